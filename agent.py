@@ -183,6 +183,7 @@ Examples:
 **Slow request investigation**: When users ask about slow requests or high latency:
 - Use `datadog_search_traces` to find slow traces (e.g., query: "service:api @duration:>1s")
 - Use `datadog_get_trace_details` to drill down into specific slow traces
+- Use `datadog_search_and_expand_traces` to search and expand the slowest traces in a single call
 - Identify bottleneck spans and their duration
 
 **APM service overview**: When users want to see all instrumented services:
@@ -190,6 +191,11 @@ Examples:
 - Filter by environment if specified
 - Help identify high-traffic services or services with low activity
 
+**Pod resource investigation**: When users ask about crashing, restarting or OOMing pods:
+- Use `datadog_get_k8s_snapshot` to get phase, restarts, CPU and memory vs limits in one call
+- Use `datadog_get_k8s_pods_multi_env` to compare pod status across environments in one call
+- Ask for environment if not specified (e.g., prod, stg, dev)
+
 ## Guidelines:
 
 1. **Be proactive**: When investigating issues, use multiple tools to gather comprehensive information.
@@ -340,6 +346,31 @@ class SREAgent:
         self._compiled_graph = graph_builder.compile(checkpointer=self._checkpointer)
         self._graph = graph_builder
 
+    def _final_response(self, result: dict) -> str:
+        """Extract the assistant's final text from a graph result."""
+        messages = result.get("messages", [])
+        for msg in reversed(messages):
+            if isinstance(msg, AIMessage) and msg.content:
+                # Handle content that might be a list
+                if isinstance(msg.content, list):
+                    text_parts = [
+                        block.get("text", "") if isinstance(block, dict) else str(block)
+                        for block in msg.content
+                    ]
+                    return "\n".join(filter(None, text_parts))
+                return msg.content
+
+        return "I apologize, but I couldn't generate a response. Please try again."
+
+    def _error_response(self, e: Exception) -> str:
+        """Map a graph error to the response returned to the user."""
+        logger.error(f"Chat error: {e}")
+        error_str = str(e)
+        # Check for token limit exceeded error
+        if "prompt is too long" in error_str or ("tokens" in error_str and "maximum" in error_str):
+            return "CONVERSATION_LIMIT_EXCEEDED"
+        return f"Error: {error_str}"
+
     def chat(self, user_message: str, thread_id: Optional[str] = None) -> str:
         """
         Send a message and get the response.
@@ -368,29 +399,42 @@ class SREAgent:
         # Run the graph
         try:
             result = self._compiled_graph.invoke(input_state, config)
+            return self._final_response(result)
+        except Exception as e:
+            return self._error_response(e)
 
-            # Extract the final response
-            messages = result.get("messages", [])
-            for msg in reversed(messages):
-                if isinstance(msg, AIMessage) and msg.content:
-                    # Handle content that might be a list
-                    if isinstance(msg.content, list):
-                        text_parts = [
-                            block.get("text", "") if isinstance(block, dict) else str(block)
-                            for block in msg.content
-                        ]
-                        return "\n".join(filter(None, text_parts))
-                    return msg.content
+    async def achat(self, user_message: str, thread_id: Optional[str] = None) -> str:
+        """
+        Async variant of chat.
+
+        Tool calls from the same turn are awaited concurrently through each
+        tool's _arun instead of blocking the event loop.
 
-            return "I apologize, but I couldn't generate a response. Please try again."
+        Args:
+            user_message: The user's message
+            thread_id: Optional thread ID for conversation persistence
 
+        Returns:
+            The assistant's response
+        """
+        if not self._compiled_graph:
+            return "Error: Agent not properly configured. Please check your API keys."
+
+        if not thread_id:
+            thread_id = str(uuid.uuid4())
+
+        input_state = {
+            "messages": [HumanMessage(content=user_message)],
+            "thread_id": thread_id,
+        }
+
+        config = {"configurable": {"thread_id": thread_id}}
+
+        try:
+            result = await self._compiled_graph.ainvoke(input_state, config)
+            return self._final_response(result)
         except Exception as e:
-            logger.error(f"Chat error: {e}")
-            error_str = str(e)
-            # Check for token limit exceeded error
-            if "prompt is too long" in error_str or ("tokens" in error_str and "maximum" in error_str):
-                return "CONVERSATION_LIMIT_EXCEEDED"
-            return f"Error: {error_str}"
+            return self._error_response(e)
 
     def chat_stream(self, user_message: str, thread_id: Optional[str] = None):
         """
@@ -430,7 +430,7 @@ async def chat(request: ChatRequest):
         raise HTTPException(status_code=400, detail="No user message provided")
 
     thread_id = request.thread_id or str(uuid.uuid4())
-    response = agent.chat(user_message, thread_id)
+    response = await agent.achat(user_message, thread_id)
 
     return ChatResponse(message=response, thread_id=thread_id)
 
@@ -0,0 +1,170 @@
+"""
+Small in-process caches for SRE Copilot tools.
+
+Monitor configs, service catalogs and node lists change on the order of
+minutes, but the agent may ask for them many times in one session.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import Lock
+from typing import Any, Callable, Hashable, NamedTuple, Optional
+import time
+
+
+class _Entry(NamedTuple):
+    """A cached value with its monotonic store and expiry times."""
+
+    stored_at: float
+    expires_at: float
+    value: Any
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed TTL.
+
+    Expired entries are not returned by get() but stay in the cache until
+    overwritten or evicted, so get_stale() can serve them (up to a maximum
+    age) as a fallback when the upstream API is failing.
+    """
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for key, or default if missing or expired.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            if time.monotonic() >= entry.expires_at:
+                return default
+
+            self._data.move_to_end(key)
+            return entry.value
+
+    def get_stale(self, key: Hashable, max_age: float) -> Optional[tuple[Any, float]]:
+        """
+        Return the last value stored for key, ignoring expiry, with its age.
+
+        Args:
+            key: Cache key
+            max_age: Entries stored longer ago than this (seconds) are ignored
+
+        Returns:
+            (value, age_seconds), or None if there is no entry young enough
+        """
+        with self._lock:
+            entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        age = time.monotonic() - entry.stored_at
+        return (entry.value, age) if age <= max_age else None
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Override the cache-wide TTL for this entry (seconds)
+        """
+        now = time.monotonic()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = _Entry(now, expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its value (expired or not), or default."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry.value
+
+    def discard(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Remove every entry whose key satisfies predicate.
+
+        Args:
+            predicate: Called with each key
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one execution.
+
+    The agent can issue identical tool calls in the same turn (or while a
+    previous one is still running); only the first caller runs the
+    function, the rest wait for and share its result or exception.
+    """
+
+    def __init__(self):
+        self._calls: dict = {}
+        self._lock = Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn() unless a call for key is already in flight, then share its outcome.
+
+        Args:
+            key: Identifies equivalent calls
+            fn: Zero-argument callable to run
+
+        Returns:
+            fn()'s return value (raises fn()'s exception)
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            value = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._calls[key]
@@ -11,10 +11,68 @@ Provides tools for:
 - Kubernetes cluster metrics (pods, nodes, deployments, containers)
 """
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Any, Optional
 import json
 
+from tools.cache import TTLCache
+
+
+# Values of the `phase` tag on kubernetes_state.pod.status_phase
+_POD_PHASES = frozenset({"pending", "running", "succeeded", "failed", "unknown"})
+
+# Monitor configs, node lists and the APM service inventory change slowly; repeat lookups are served
+# from memory for this long (seconds)
+_CACHE_TTL = 60
+
+# bulk_k8s_snapshot queries, sent in one request and told apart by query_index.
+# Formatted with the tag filter; all are grouped per pod.
+_K8S_SNAPSHOT_QUERIES = (
+    ("phase", "sum:kubernetes_state.pod.status_phase{{{filters}}} by {{kube_namespace,pod_name,phase}}"),
+    ("restarts", "sum:kubernetes_state.container.restarts{{{filters}}} by {{kube_namespace,pod_name}}"),
+    ("cpu", "avg:kubernetes.cpu.usage.total{{{filters}}} by {{kube_namespace,pod_name}}"),
+    ("memory", "avg:kubernetes.memory.usage{{{filters}}} by {{kube_namespace,pod_name}}"),
+    ("memory_limit", "avg:kubernetes.memory.limits{{{filters}}} by {{kube_namespace,pod_name}}"),
+)
+
+# Keep-alive connections held by the shared ApiClient. The agent fans tool
+# calls out in parallel; without enough pooled connections urllib3 opens
+# (and TLS-handshakes) a fresh one per call and then discards it.
+_CONNECTION_POOL_MAXSIZE = 32
+
+# Upper bound on concurrent per-environment queries in the *_multi_env tools
+_MAX_ENV_WORKERS = 8
+
+# search_traces scans at most limit * _TRACE_SCAN_FACTOR spans while deduplicating
+_TRACE_SCAN_FACTOR = 10
+
+# search_and_expand_traces ranks this many recent traces by duration and
+# fetches details for at most _MAX_EXPANDED_TRACES of them
+_EXPAND_CANDIDATES = 50
+_MAX_EXPANDED_TRACES = 10
+
+# Map common environment aliases to actual Datadog env tags
+_ENV_ALIASES = {
+    "prod": "production",
+    "prd": "production",
+    "stage": "stg",
+    "staging": "stg",
+    "development": "dev",
+}
+
+# get_service_stats query templates, formatted with span_type and scope
+# ("service:<name>[,env:<env>]").
+# Note: Percentile metrics use a different format:
+# trace.<span_type>.duration.by.service.99p instead of p99:trace.<span_type>.duration
+_SERVICE_STATS_QUERIES = {
+    "latency_avg": "avg:trace.{span_type}.duration{{{scope}}}",
+    "latency_p95": "avg:trace.{span_type}.duration.by.service.95p{{{scope}}}",
+    "latency_p99": "avg:trace.{span_type}.duration.by.service.99p{{{scope}}}",
+    "requests": "sum:trace.{span_type}.hits{{{scope}}}.as_rate()",
+    "errors": "sum:trace.{span_type}.errors{{{scope}}}.as_rate()",
+}
+
 
 @dataclass
 class DatadogTools:
@@ -26,6 +84,7 @@ class DatadogTools:
     _api_client: Any = None
     _v1_client: Any = None
     _v2_client: Any = None
+    _cache: TTLCache = field(default_factory=lambda: TTLCache(ttl=_CACHE_TTL), repr=False)
 
     def __post_init__(self):
         """Initialize Datadog API clients lazily."""
@@ -39,6 +98,14 @@ class DatadogTools:
             self._configuration.api_key["apiKeyAuth"] = self.api_key
             self._configuration.api_key["appKeyAuth"] = self.app_key
             self._configuration.server_variables["site"] = self.site
+            self._configuration.connection_pool_maxsize = _CONNECTION_POOL_MAXSIZE
+            # Ask for gzip-encoded responses; trace and metric payloads are
+            # JSON and shrink several-fold. urllib3 decodes transparently.
+            self._configuration.compress = True
+            # Retry 429/5xx with backoff inside the SDK (honours the
+            # rate-limit reset headers) instead of failing the tool call.
+            self._configuration.enable_retry = True
+            self._configuration.max_retries = 3
 
             # In datadog-api-client v2.x, use single ApiClient for both v1 and v2 APIs
             # Must enter context to initialize properly
@@ -138,12 +205,13 @@ class DatadogTools:
         except Exception as e:
             return self._handle_error(e, "fetch monitors")
 
-    def get_monitor_details(self, monitor_id: int) -> dict:
+    def get_monitor_details(self, monitor_id: int, fresh: bool = False) -> dict:
         """
         Get detailed information about a specific monitor.
 
         Args:
             monitor_id: The monitor ID
+            fresh: Bypass the in-process cache and query Datadog directly
 
         Returns:
             Monitor details including query, thresholds, and recent status
@@ -151,13 +219,19 @@ class DatadogTools:
         if not self._ensure_client():
             return {"error": "Datadog client not configured"}
 
+        cache_key = ("monitor_details", monitor_id)
+        if not fresh:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             from datadog_api_client.v1.api.monitors_api import MonitorsApi
 
             api = MonitorsApi(self._v1_client)
             monitor = api.get_monitor(monitor_id=monitor_id)
 
-            return {
+            result = {
                 "id": monitor.id,
                 "name": monitor.name,
                 "type": str(monitor.type) if monitor.type else None,
@@ -173,6 +247,8 @@ class DatadogTools:
                     "evaluation_delay": monitor.options.evaluation_delay if monitor.options else None,
                 } if monitor.options else None,
             }
+            self._cache.set(cache_key, result)
+            return result
 
         except Exception as e:
             return self._handle_error(e, "fetch monitor details")
@@ -363,6 +439,7 @@ class DatadogTools:
         self,
         env: Optional[str] = None,
         limit: int = 50,
+        fresh: bool = False,
     ) -> dict:
         """
         List APM services with their statistics.
@@ -370,6 +447,7 @@ class DatadogTools:
         Args:
             env: Filter by environment (e.g., "prod", "staging")
             limit: Maximum services to return
+            fresh: Bypass the in-process cache and query Datadog directly
 
         Returns:
             List of APM services with stats
@@ -377,6 +455,12 @@ class DatadogTools:
         if not self._ensure_client():
             return {"error": "Datadog client not configured"}
 
+        cache_key = ("apm_services", env.lower() if env else None, limit)
+        if not fresh:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             from datadog_api_client.v1.api.metrics_api import MetricsApi
             import time
@@ -387,15 +471,7 @@ class DatadogTools:
             now = int(time.time())
             from_ts = now - 3600  # Last hour
 
-            # Map common environment aliases to actual Datadog env tags
-            env_mapping = {
-                "prod": "production",
-                "prd": "production",
-                "stage": "stg",
-                "staging": "stg",
-                "development": "dev",
-            }
-            actual_env = env_mapping.get(env.lower(), env) if env else None
+            actual_env = _ENV_ALIASES.get(env.lower(), env) if env else None
             env_filter = f",env:{actual_env}" if actual_env else ""
 
             # Try multiple span types to discover all services
@@ -454,12 +530,14 @@ class DatadogTools:
             # Sort by requests descending
             services.sort(key=lambda x: x["requests_last_hour"], reverse=True)
 
-            return {
+            result = {
                 "services": services[:limit],
                 "count": len(services[:limit]),
                 "total_discovered": len(services),
                 "env_filter": env,
             }
+            self._cache.set(cache_key, result)
+            return result
 
         except Exception as e:
             return self._handle_error(e, "fetch APM services")
@@ -498,15 +576,7 @@ class DatadogTools:
             now = int(time.time())
             from_ts = now - 900  # Last 15 minutes for faster discovery
 
-            # Map common environment aliases to actual Datadog env tags
-            env_mapping = {
-                "prod": "production",
-                "prd": "production",
-                "stage": "stg",
-                "staging": "stg",
-                "development": "dev",
-            }
-            actual_env = env_mapping.get(env.lower(), env) if env else None
+            actual_env = _ENV_ALIASES.get(env.lower(), env) if env else None
             env_filter = f",env:{actual_env}" if actual_env else ""
 
             # Common span types to try, ordered by likelihood
@@ -585,15 +655,7 @@ class DatadogTools:
             from_ts = parse_time(from_time)
             to_ts = parse_time(to_time)
 
-            # Map common environment aliases to actual Datadog env tags
-            env_mapping = {
-                "prod": "production",
-                "prd": "production",
-                "stage": "stg",
-                "staging": "stg",
-                "development": "dev",
-            }
-            actual_env = env_mapping.get(env.lower(), env) if env else None
+            actual_env = _ENV_ALIASES.get(env.lower(), env) if env else None
             env_filter = f",env:{actual_env}" if actual_env else ""
 
             # Discover the actual span name used by this service
@@ -615,16 +677,13 @@ class DatadogTools:
             results = {}
             successful_span_type = None
 
+            scope = f"service:{service}{env_filter}"
+
             # Try each span type until we find one with data
             for span_type in span_types_to_try:
-                # Note: Percentile metrics use a different format:
-                # trace.<span_type>.duration.by.service.99p instead of p99:trace.<span_type>.duration
                 metrics = {
-                    "latency_avg": f"avg:trace.{span_type}.duration{{service:{service}{env_filter}}}",
-                    "latency_p95": f"avg:trace.{span_type}.duration.by.service.95p{{service:{service}{env_filter}}}",
-                    "latency_p99": f"avg:trace.{span_type}.duration.by.service.99p{{service:{service}{env_filter}}}",
-                    "requests": f"sum:trace.{span_type}.hits{{service:{service}{env_filter}}}.as_rate()",
-                    "errors": f"sum:trace.{span_type}.errors{{service:{service}{env_filter}}}.as_rate()",
+                    name: template.format(span_type=span_type, scope=scope)
+                    for name, template in _SERVICE_STATS_QUERIES.items()
                 }
 
                 temp_results = {}
@@ -763,12 +822,17 @@ class DatadogTools:
                 ),
             )
 
-            response = api.list_spans(body=body)
-
             traces = []
             seen_trace_ids = set()
 
-            for span in response.data or []:
+            # Iterate spans lazily across pages and stop as soon as `limit`
+            # distinct traces are collected; cap the scan so a query dominated
+            # by a few huge traces can't page through the whole window.
+            max_spans = limit * _TRACE_SCAN_FACTOR
+            for scanned, span in enumerate(api.list_spans_with_pagination(body=body)):
+                if len(traces) >= limit or scanned >= max_spans:
+                    break
+
                 attrs = span.attributes
                 trace_id = attrs.attributes.get("trace_id") if attrs.attributes else None
 
@@ -895,6 +959,52 @@ class DatadogTools:
         except Exception as e:
             return self._handle_error(e, "fetch trace details")
 
+    def search_and_expand_traces(
+        self,
+        query: str,
+        from_time: str = "now-15m",
+        to_time: str = "now",
+        top_k: int = 3,
+    ) -> dict:
+        """
+        Search APM traces and fetch full details for the slowest ones.
+
+        Combines search_traces and get_trace_details in one call: the most
+        recent matching traces are ranked by duration and the top_k are
+        expanded concurrently.
+
+        Args:
+            query: Trace search query (e.g., "service:api @duration:>1s")
+            from_time: Start time
+            to_time: End time
+            top_k: Number of slowest traces to expand
+
+        Returns:
+            Details for the slowest matching traces, slowest first
+        """
+        top_k = max(1, min(top_k, _MAX_EXPANDED_TRACES))
+        search = self.search_traces(query, from_time=from_time, to_time=to_time, limit=_EXPAND_CANDIDATES)
+        if "error" in search:
+            return search
+
+        candidates = [t for t in search["traces"] if t.get("trace_id")]
+        candidates.sort(key=lambda t: t.get("duration_ns") or 0, reverse=True)
+        trace_ids = [t["trace_id"] for t in candidates[:top_k]]
+
+        details = []
+        if trace_ids:
+            with ThreadPoolExecutor(max_workers=len(trace_ids)) as pool:
+                details = list(pool.map(self.get_trace_details, trace_ids))
+
+        return {
+            "query": query,
+            "from": from_time,
+            "to": to_time,
+            "searched": search["count"],
+            "top_traces": details,
+            "count": len(details),
+        }
+
     def get_k8s_pods(
         self,
         env: Optional[str] = None,
@@ -942,10 +1052,16 @@ class DatadogTools:
                 filters.append(f"kube_deployment:{app}")
             filter_str = ",".join(filters) if filters else "*"
 
+            # Plain pod phases can be filtered by Datadog; derived statuses
+            # (CrashLoopBackOff, high restarts) are still matched below.
+            phase_filter = ""
+            if status and status.lower() in _POD_PHASES:
+                phase_filter = f",phase:{status.lower()}"
+
             pods = {}
 
             # Query pod phase counts
-            phase_query = f"sum:kubernetes_state.pod.status_phase{{{filter_str}}} by {{kube_namespace,pod_name,phase}}"
+            phase_query = f"sum:kubernetes_state.pod.status_phase{{{filter_str}{phase_filter}}} by {{kube_namespace,pod_name,phase}}"
             phase_response = api.query_metrics(_from=from_ts, to=now, query=phase_query)
 
             for series in phase_response.series or []:
@@ -1051,11 +1167,55 @@ class DatadogTools:
         except Exception as e:
             return self._handle_error(e, "fetch K8s pods")
 
+    def get_k8s_pods_multi_env(
+        self,
+        envs: list[str],
+        namespace: Optional[str] = None,
+        status: Optional[str] = None,
+        app: Optional[str] = None,
+        limit: int = 50,
+    ) -> dict:
+        """
+        Get Kubernetes pod status for several environments concurrently.
+
+        Each environment is queried through get_k8s_pods on its own worker
+        thread; the workers share the client's connection pool.
+
+        Args:
+            envs: Environments to query (e.g., ["prod", "stg"])
+            namespace: Filter by namespace
+            status: Filter by status (Running, Pending, Failed, Succeeded, CrashLoopBackOff)
+            app: Filter by app/deployment name
+            limit: Maximum pods to return per environment
+
+        Returns:
+            Per-environment pod results keyed by env
+        """
+        if not self._ensure_client():
+            return {"error": "Datadog client not configured"}
+
+        envs = list(dict.fromkeys(envs or []))
+        if not envs:
+            return {"error": "At least one environment is required"}
+
+        def fetch(env: str) -> dict:
+            return self.get_k8s_pods(env=env, namespace=namespace, status=status, app=app, limit=limit)
+
+        with ThreadPoolExecutor(max_workers=min(len(envs), _MAX_ENV_WORKERS)) as pool:
+            results = dict(zip(envs, pool.map(fetch, envs)))
+
+        return {
+            "environments": results,
+            "total_count": sum(r.get("total_count", 0) for r in results.values()),
+            "errors": {env: r["error"] for env, r in results.items() if "error" in r},
+        }
+
     def get_k8s_nodes(
         self,
         env: Optional[str] = None,
         cluster: Optional[str] = None,
         limit: int = 50,
+        fresh: bool = False,
     ) -> dict:
         """
         Get Kubernetes node status and capacity.
@@ -1064,6 +1224,7 @@ class DatadogTools:
             env: Environment filter (prod, stg, dev)
             cluster: Filter by cluster name
             limit: Maximum nodes to return
+            fresh: Bypass the in-process cache and query Datadog directly
 
         Returns:
             Node status, capacity, and resource usage
@@ -1071,6 +1232,12 @@ class DatadogTools:
         if not self._ensure_client():
             return {"error": "Datadog client not configured"}
 
+        cache_key = ("k8s_nodes", env.lower() if env else None, cluster, limit)
+        if not fresh:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             from datadog_api_client.v1.api.metrics_api import MetricsApi
             import time
@@ -1179,12 +1346,14 @@ class DatadogTools:
                 status = node.get("status", "Unknown")
                 status_counts[status] = status_counts.get(status, 0) + 1
 
-            return {
+            result = {
                 "nodes": result_list[:limit],
                 "total_count": len(result_list),
                 "status_summary": status_counts,
                 "cluster": cluster,
             }
+            self._cache.set(cache_key, result)
+            return result
 
         except Exception as e:
             return self._handle_error(e, "fetch K8s nodes")
@@ -1464,6 +1633,139 @@ class DatadogTools:
         except Exception as e:
             return self._handle_error(e, "fetch K8s containers")
 
+    def bulk_k8s_snapshot(
+        self,
+        env: Optional[str] = None,
+        cluster: Optional[str] = None,
+        namespace: Optional[str] = None,
+        pod: Optional[str] = None,
+        limit: int = 50,
+    ) -> dict:
+        """
+        Get pod phase, restarts, CPU and memory in a single metrics request.
+
+        Covers what get_k8s_pods and get_k8s_containers return at pod level,
+        for investigations (e.g. OOMs) that would otherwise need both.
+
+        Args:
+            env: Environment filter (prod, stg, dev)
+            cluster: Filter by cluster name
+            namespace: Filter by namespace
+            pod: Filter by pod name
+            limit: Maximum pods to return
+
+        Returns:
+            Per-pod phase, restarts, and resource usage
+        """
+        if not self._ensure_client():
+            return {"error": "Datadog client not configured"}
+
+        try:
+            from datadog_api_client.v1.api.metrics_api import MetricsApi
+            import time
+
+            api = MetricsApi(self._v1_client)
+            now = int(time.time())
+            from_ts = now - 300  # Last 5 minutes for fresher data
+
+            filters = []
+            if env:
+                filters.append(f"env:{env}")
+            if cluster:
+                filters.append(f"kube_cluster_name:{cluster}")
+            if namespace:
+                filters.append(f"kube_namespace:{namespace}")
+            if pod:
+                filters.append(f"pod_name:{pod}")
+            filter_str = ",".join(filters) if filters else "*"
+
+            # Datadog evaluates comma-separated queries in one request and
+            # tags each returned series with the index of its query
+            query = ",".join(
+                template.format(filters=filter_str) for _, template in _K8S_SNAPSHOT_QUERIES
+            )
+            response = api.query_metrics(_from=from_ts, to=now, query=query)
+
+            pods = {}
+            for series in response.series or []:
+                if not series.pointlist:
+                    continue
+                value = series.pointlist[-1].value[1] or 0
+
+                tags = dict(
+                    part.split(":", 1) for part in (series.scope or "").split(",") if ":" in part
+                )
+                pod_name = tags.get("pod_name")
+                if not pod_name:
+                    continue
+
+                ns = tags.get("kube_namespace")
+                key = f"{ns}/{pod_name}"
+                entry = pods.setdefault(key, {"namespace": ns, "pod": pod_name, "phase": "Unknown"})
+
+                metric = _K8S_SNAPSHOT_QUERIES[int(series.query_index)][0]
+                if metric == "phase":
+                    # Only set phase when metric value > 0 (pod is actually in this phase)
+                    if value > 0 and tags.get("phase"):
+                        entry["phase"] = tags["phase"].capitalize()
+                elif metric == "restarts":
+                    entry["restarts"] = int(value)
+                elif metric == "cpu":
+                    # CPU in nanocores, convert to millicores
+                    entry["cpu_millicores"] = round(value / 1e6, 2)
+                elif metric == "memory":
+                    entry["memory_mb"] = round(value / (1024**2), 2)
+                elif metric == "memory_limit":
+                    entry["memory_limit_mb"] = round(value / (1024**2), 2)
+
+            for entry in pods.values():
+                if entry.get("memory_mb") and entry.get("memory_limit_mb"):
+                    entry["memory_percent"] = round(
+                        (entry["memory_mb"] / entry["memory_limit_mb"]) * 100, 1
+                    )
+
+            result_list = list(pods.values())
+            # Problematic pods first: most restarts, then highest memory pressure
+            result_list.sort(
+                key=lambda x: (x.get("restarts", 0), x.get("memory_percent", 0)), reverse=True
+            )
+
+            return {
+                "pods": result_list[:limit],
+                "total_count": len(result_list),
+                "filters": {"cluster": cluster, "namespace": namespace, "pod": pod},
+                "note": "Data from Datadog metrics (may have 1-2 min lag vs kubectl).",
+            }
+
+        except Exception as e:
+            return self._handle_error(e, "fetch K8s snapshot")
+
+
+# Property fragments shared by the tool specs below. The specs are only read
+# (and serialized) after import, so sharing the dicts between tools is safe.
+_K8S_ENV_PROP = {
+    "type": "string",
+    "description": "Environment: prod, stg, or dev (REQUIRED - ask user if not specified)",
+    "enum": ["prod", "stg", "dev"],
+}
+_ENV_WARN = "IMPORTANT: Always ask user for environment (prod/stg/dev) if not specified."
+_CLUSTER_PROP = {"type": "string", "description": "Filter by cluster name"}
+_NAMESPACE_PROP = {"type": "string", "description": "Filter by namespace"}
+_FRESH_PROP = {
+    "type": "boolean",
+    "description": "Skip the 60s cache and fetch live data (default: false)",
+    "default": False,
+}
+
+
+def _limit_prop(noun: str, default: int = 50) -> dict:
+    """Integer result cap with its default echoed in the description."""
+    return {
+        "type": "integer",
+        "description": f"Maximum {noun} to return (default: {default})",
+        "default": default,
+    }
+
 
 # Tool definitions for Claude
 DATADOG_TOOLS = [
@@ -1475,8 +1777,8 @@ DATADOG_TOOLS = [
             "properties": {
                 "status_filter": {
                     "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Filter by status: 'Alert', 'Warn', 'OK', 'No Data'. Leave empty for all.",
+                    "items": {"type": "string", "enum": ["Alert", "Warn", "OK", "No Data"]},
+                    "description": "Filter by status. Leave empty for all.",
                 },
                 "name_filter": {
                     "type": "string",
@@ -1500,6 +1802,7 @@ DATADOG_TOOLS = [
                     "type": "integer",
                     "description": "The Datadog monitor ID",
                 },
+                "fresh": _FRESH_PROP,
             },
             "required": ["monitor_id"],
         },
@@ -1557,11 +1860,7 @@ DATADOG_TOOLS = [
                     "type": "string",
                     "description": "Filter dashboards by name (substring match)",
                 },
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum dashboards to return (default: 20)",
-                    "default": 20,
-                },
+                "limit": _limit_prop("dashboards", default=20),
             },
         },
     },
@@ -1575,11 +1874,7 @@ DATADOG_TOOLS = [
                     "type": "string",
                     "description": "Filter by environment (e.g., 'prod', 'staging')",
                 },
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum services to return (default: 50)",
-                    "default": 50,
-                },
+                "limit": _limit_prop("services"),
             },
         },
     },
@@ -1631,11 +1926,7 @@ DATADOG_TOOLS = [
                     "description": "End time. Default: 'now'",
                     "default": "now",
                 },
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum traces to return (default: 50)",
-                    "default": 50,
-                },
+                "limit": _limit_prop("traces"),
             },
             "required": ["query"],
         },
@@ -1655,24 +1946,43 @@ DATADOG_TOOLS = [
         },
     },
     {
-        "name": "datadog_get_k8s_pods",
-        "description": "Get Kubernetes pod status, restarts, and health. Use this to check pod status, find crashing pods, or investigate restart loops. IMPORTANT: Always ask user for environment (prod/stg/dev) if not specified. Note: Datadog metrics may have 1-2 min lag vs kubectl for real-time status.",
+        "name": "datadog_search_and_expand_traces",
+        "description": "Search APM traces and return full span details for the slowest matches in one call. Prefer this over datadog_search_traces followed by datadog_get_trace_details when investigating latency.",
         "input_schema": {
             "type": "object",
             "properties": {
-                "env": {
+                "query": {
                     "type": "string",
-                    "description": "Environment: prod, stg, or dev (REQUIRED - ask user if not specified)",
-                    "enum": ["prod", "stg", "dev"],
+                    "description": "Trace search query (e.g., 'service:api', 'service:api @duration:>1s', 'service:api status:error')",
                 },
-                "cluster": {
+                "from_time": {
                     "type": "string",
-                    "description": "Filter by cluster name",
+                    "description": "Start time (e.g., 'now-15m', 'now-1h'). Default: 'now-15m'",
+                    "default": "now-15m",
                 },
-                "namespace": {
+                "to_time": {
                     "type": "string",
-                    "description": "Filter by namespace",
+                    "description": "End time. Default: 'now'",
+                    "default": "now",
+                },
+                "top_k": {
+                    "type": "integer",
+                    "description": f"Number of slowest traces to expand (max {_MAX_EXPANDED_TRACES}). Default: 3",
+                    "default": 3,
                 },
+            },
+            "required": ["query"],
+        },
+    },
+    {
+        "name": "datadog_get_k8s_pods",
+        "description": f"Get Kubernetes pod status, restarts, and health. Use this to check pod status, find crashing pods, or investigate restart loops. {_ENV_WARN} Note: Datadog metrics may have 1-2 min lag vs kubectl for real-time status.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "env": _K8S_ENV_PROP,
+                "cluster": _CLUSTER_PROP,
+                "namespace": _NAMESPACE_PROP,
                 "app": {
                     "type": "string",
                     "description": "Filter by app/deployment name (e.g., 'mono', 'bumblebee')",
@@ -1681,92 +1991,92 @@ DATADOG_TOOLS = [
                     "type": "string",
                     "description": "Filter by status: Running, Pending, Failed, Succeeded, CrashLoopBackOff",
                 },
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum pods to return (default: 50)",
-                    "default": 50,
-                },
+                "limit": _limit_prop("pods"),
             },
         },
     },
     {
-        "name": "datadog_get_k8s_nodes",
-        "description": "Get Kubernetes node status, capacity, and resource usage. Use this to check node health, find overloaded nodes, or investigate capacity issues. IMPORTANT: Always ask user for environment (prod/stg/dev) if not specified.",
+        "name": "datadog_get_k8s_pods_multi_env",
+        "description": "Get Kubernetes pod status for several environments at once (queried in parallel). Use this instead of calling datadog_get_k8s_pods once per environment.",
         "input_schema": {
             "type": "object",
             "properties": {
-                "env": {
-                    "type": "string",
-                    "description": "Environment: prod, stg, or dev (REQUIRED - ask user if not specified)",
-                    "enum": ["prod", "stg", "dev"],
+                "envs": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": ["prod", "stg", "dev"]},
+                    "description": "Environments to query",
                 },
-                "cluster": {
+                "namespace": _NAMESPACE_PROP,
+                "app": {
                     "type": "string",
-                    "description": "Filter by cluster name",
+                    "description": "Filter by app/deployment name (e.g., 'mono', 'bumblebee')",
                 },
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum nodes to return (default: 50)",
-                    "default": 50,
+                "status": {
+                    "type": "string",
+                    "description": "Filter by status: Running, Pending, Failed, Succeeded, CrashLoopBackOff",
                 },
+                "limit": _limit_prop("pods per environment"),
+            },
+            "required": ["envs"],
+        },
+    },
+    {
+        "name": "datadog_get_k8s_nodes",
+        "description": f"Get Kubernetes node status, capacity, and resource usage. Use this to check node health, find overloaded nodes, or investigate capacity issues. {_ENV_WARN}",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "env": _K8S_ENV_PROP,
+                "cluster": _CLUSTER_PROP,
+                "limit": _limit_prop("nodes"),
+                "fresh": _FRESH_PROP,
             },
         },
     },
     {
         "name": "datadog_get_k8s_deployments",
-        "description": "Get Kubernetes deployment status and replica counts. Use this to check deployment health, find degraded deployments, or verify rollouts. IMPORTANT: Always ask user for environment (prod/stg/dev) if not specified.",
+        "description": f"Get Kubernetes deployment status and replica counts. Use this to check deployment health, find degraded deployments, or verify rollouts. {_ENV_WARN}",
         "input_schema": {
             "type": "object",
             "properties": {
-                "env": {
-                    "type": "string",
-                    "description": "Environment: prod, stg, or dev (REQUIRED - ask user if not specified)",
-                    "enum": ["prod", "stg", "dev"],
-                },
-                "cluster": {
-                    "type": "string",
-                    "description": "Filter by cluster name",
-                },
-                "namespace": {
-                    "type": "string",
-                    "description": "Filter by namespace",
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum deployments to return (default: 50)",
-                    "default": 50,
-                },
+                "env": _K8S_ENV_PROP,
+                "cluster": _CLUSTER_PROP,
+                "namespace": _NAMESPACE_PROP,
+                "limit": _limit_prop("deployments"),
             },
         },
     },
     {
         "name": "datadog_get_k8s_containers",
-        "description": "Get Kubernetes container CPU and memory usage. Use this to find resource-hungry containers, investigate OOM issues, or check resource utilization. IMPORTANT: Always ask user for environment (prod/stg/dev) if not specified.",
+        "description": f"Get Kubernetes container CPU and memory usage. Use this to find resource-hungry containers, investigate OOM issues, or check resource utilization. {_ENV_WARN}",
         "input_schema": {
             "type": "object",
             "properties": {
-                "env": {
-                    "type": "string",
-                    "description": "Environment: prod, stg, or dev (REQUIRED - ask user if not specified)",
-                    "enum": ["prod", "stg", "dev"],
-                },
-                "cluster": {
-                    "type": "string",
-                    "description": "Filter by cluster name",
-                },
-                "namespace": {
+                "env": _K8S_ENV_PROP,
+                "cluster": _CLUSTER_PROP,
+                "namespace": _NAMESPACE_PROP,
+                "pod": {
                     "type": "string",
-                    "description": "Filter by namespace",
+                    "description": "Filter by pod name",
                 },
+                "limit": _limit_prop("containers"),
+            },
+        },
+    },
+    {
+        "name": "datadog_get_k8s_snapshot",
+        "description": f"Get pod phase, restarts, CPU and memory usage vs limits in one call. Prefer this over separate pod and container lookups when investigating crashing or OOMing pods. {_ENV_WARN}",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "env": _K8S_ENV_PROP,
+                "cluster": _CLUSTER_PROP,
+                "namespace": _NAMESPACE_PROP,
                 "pod": {
                     "type": "string",
                     "description": "Filter by pod name",
                 },
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum containers to return (default: 50)",
-                    "default": 50,
-                },
+                "limit": _limit_prop("pods"),
             },
         },
     },
@@ -9,9 +9,90 @@ Provides tools for:
 - Supporting multi-container pods
 """
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Any, Optional
 import os
+import re
+
+from tools.cache import TTLCache
+
+# Namespace lists change rarely; repeat lookups are served from memory
+# for this long (seconds)
+_CACHE_TTL = 30
+
+# Per-context API clients are rebuilt from kubeconfig after this long
+# (seconds), so rotated credentials or an edited kubeconfig are picked up
+_CLIENT_TTL = 300
+
+# find_and_fetch_logs: default pod cap and concurrent log reads
+_MAX_LOG_PODS = 5
+_LOG_FETCH_WORKERS = 5
+
+# list_pods_multi_namespace: concurrent per-namespace list requests
+_NAMESPACE_WORKERS = 16
+
+# Server-side cap on bytes returned per log request (kube API limitBytes)
+_LOG_LIMIT_BYTES = 1_048_576
+
+# Bytes read per chunk when streaming logs for a grep filter
+_LOG_CHUNK_SIZE = 65536
+
+
+def _summarize_pod(pod: Any) -> dict:
+    """Summarize a V1Pod the way `kubectl get pods` does."""
+    # Get pod status
+    status = pod.status.phase
+
+    # Count restarts
+    restart_count = 0
+    if pod.status.container_statuses:
+        restart_count = sum(cs.restart_count for cs in pod.status.container_statuses)
+
+    # Get ready status
+    ready = "0/0"
+    if pod.status.container_statuses:
+        ready_containers = sum(1 for cs in pod.status.container_statuses if cs.ready)
+        total_containers = len(pod.status.container_statuses)
+        ready = f"{ready_containers}/{total_containers}"
+
+    # Get age
+    age = ""
+    if pod.metadata.creation_timestamp:
+        from datetime import datetime, timezone
+        age_seconds = (datetime.now(timezone.utc) - pod.metadata.creation_timestamp).total_seconds()
+        if age_seconds < 60:
+            age = f"{int(age_seconds)}s"
+        elif age_seconds < 3600:
+            age = f"{int(age_seconds / 60)}m"
+        elif age_seconds < 86400:
+            age = f"{int(age_seconds / 3600)}h"
+        else:
+            age = f"{int(age_seconds / 86400)}d"
+
+    return {
+        "name": pod.metadata.name,
+        "ready": ready,
+        "status": status,
+        "restarts": restart_count,
+        "age": age,
+        "node": pod.spec.node_name or "N/A",
+    }
+
+
+def _is_unhealthy(pod: dict) -> bool:
+    """
+    Whether a pod summary needs attention.
+
+    CrashLoopBackOff pods keep phase Running, so readiness is checked too.
+    Completed (Succeeded) pods are healthy.
+    """
+    if pod["status"] == "Succeeded":
+        return False
+    if pod["status"] != "Running":
+        return True
+    ready, _, total = pod["ready"].partition("/")
+    return ready != total
 
 
 @dataclass
@@ -22,6 +103,9 @@ class KubernetesTools:
     _client: Any = None
     _config: Any = None
     _contexts: list[dict] = None
+    _cache: TTLCache = field(default_factory=lambda: TTLCache(ttl=_CACHE_TTL), repr=False)
+    # context name -> CoreV1Api bound to that context's cluster
+    _clients: TTLCache = field(default_factory=lambda: TTLCache(ttl=_CLIENT_TTL), repr=False)
 
     def __post_init__(self):
         """Initialize Kubernetes client lazily."""
@@ -45,8 +129,9 @@ class KubernetesTools:
                 self._contexts = contexts
 
                 # Initialize client with default context
-                config.load_kube_config(config_file=expanded_path)
-                self._client = client.CoreV1Api()
+                self._client = client.CoreV1Api(
+                    config.new_client_from_config(config_file=expanded_path)
+                )
             except ConfigException as e:
                 print(f"Failed to load kubeconfig: {e}")
         except ImportError as e:
@@ -56,20 +141,69 @@ class KubernetesTools:
         """Ensure Kubernetes client is initialized."""
         return self._client is not None
 
-    def _load_context(self, context_name: str) -> bool:
-        """Load a specific Kubernetes context."""
+    def _context_client(self, context_name: str) -> Any:
+        """
+        Return a CoreV1Api bound to a specific Kubernetes context, or None.
+
+        Each context gets its own ApiClient (new_client_from_config) rather
+        than load_kube_config, which rewrites the process-wide default
+        configuration: concurrent calls for different contexts would
+        otherwise query whichever cluster was loaded last.
+        """
+        api = self._clients.get(context_name)
+        if api is not None:
+            return api
+
         try:
             from kubernetes import client
 
             expanded_path = os.path.expanduser(self.kubeconfig_path)
-            self._config.load_kube_config(
-                config_file=expanded_path, context=context_name
+            api = client.CoreV1Api(
+                self._config.new_client_from_config(config_file=expanded_path, context=context_name)
             )
-            self._client = client.CoreV1Api()
-            return True
         except Exception as e:
             print(f"Failed to load context {context_name}: {e}")
-            return False
+            return None
+
+        self._clients.set(context_name, api)
+        return api
+
+    def _grep_pod_log(self, api: Any, kwargs: dict, pattern: re.Pattern) -> tuple[list[str], int, int]:
+        """
+        Stream a pod log and keep only the lines matching pattern.
+
+        The log is read in chunks instead of being buffered whole, so large
+        tails never sit in memory as one string.
+
+        Returns:
+            Tuple of (matching lines, total lines scanned, bytes read)
+        """
+        response = api.read_namespaced_pod_log(_preload_content=False, **kwargs)
+
+        matches = []
+        scanned = 0
+        bytes_read = 0
+        pending = b""
+        try:
+            for chunk in response.stream(_LOG_CHUNK_SIZE):
+                bytes_read += len(chunk)
+                pending += chunk
+                *lines, pending = pending.split(b"\n")
+                for line in lines:
+                    scanned += 1
+                    text = line.decode("utf-8", errors="replace")
+                    if pattern.search(text):
+                        matches.append(text)
+
+            if pending:
+                scanned += 1
+                text = pending.decode("utf-8", errors="replace")
+                if pattern.search(text):
+                    matches.append(text)
+        finally:
+            response.release_conn()
+
+        return matches, scanned, bytes_read
 
     def get_contexts(self) -> dict:
         """
@@ -108,12 +242,13 @@ class KubernetesTools:
         except Exception as e:
             return {"error": f"Failed to list contexts: {str(e)}"}
 
-    def get_namespaces(self, context: str) -> dict:
+    def get_namespaces(self, context: str, fresh: bool = False) -> dict:
         """
         List namespaces in the specified Kubernetes cluster.
 
         Args:
             context: Kubernetes context name
+            fresh: Bypass the in-process cache and query the cluster directly
 
         Returns:
             Dictionary with namespaces list
@@ -126,22 +261,28 @@ class KubernetesTools:
                 "Please ensure kubectl is configured."
             }
 
-        # Load the specified context
-        if not self._load_context(context):
-            return {"error": f"Failed to load context: {context}"}
+        cache_key = ("namespaces", context)
+        if not fresh:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-        if not self._ensure_client():
-            return {"error": "Kubernetes client not configured"}
+        # Client for the specified context
+        api = self._context_client(context)
+        if api is None:
+            return {"error": f"Failed to load context: {context}"}
 
         try:
-            namespaces = self._client.list_namespace()
+            namespaces = api.list_namespace()
             namespace_list = [ns.metadata.name for ns in namespaces.items]
 
-            return {
+            result = {
                 "namespaces": sorted(namespace_list),
                 "count": len(namespace_list),
                 "context": context,
             }
+            self._cache.set(cache_key, result)
+            return result
         except Exception as e:
             return {"error": f"Failed to list namespaces in context {context}: {str(e)}"}
 
@@ -168,55 +309,14 @@ class KubernetesTools:
                 "Please ensure kubectl is configured."
             }
 
-        # Load the specified context
-        if not self._load_context(context):
+        # Client for the specified context
+        api = self._context_client(context)
+        if api is None:
             return {"error": f"Failed to load context: {context}"}
 
-        if not self._ensure_client():
-            return {"error": "Kubernetes client not configured"}
-
         try:
-            pods = self._client.list_namespaced_pod(namespace=namespace)
-
-            pod_list = []
-            for pod in pods.items:
-                # Get pod status
-                status = pod.status.phase
-
-                # Count restarts
-                restart_count = 0
-                if pod.status.container_statuses:
-                    restart_count = sum(cs.restart_count for cs in pod.status.container_statuses)
-
-                # Get ready status
-                ready = "0/0"
-                if pod.status.container_statuses:
-                    ready_containers = sum(1 for cs in pod.status.container_statuses if cs.ready)
-                    total_containers = len(pod.status.container_statuses)
-                    ready = f"{ready_containers}/{total_containers}"
-
-                # Get age
-                age = ""
-                if pod.metadata.creation_timestamp:
-                    from datetime import datetime, timezone
-                    age_seconds = (datetime.now(timezone.utc) - pod.metadata.creation_timestamp).total_seconds()
-                    if age_seconds < 60:
-                        age = f"{int(age_seconds)}s"
-                    elif age_seconds < 3600:
-                        age = f"{int(age_seconds / 60)}m"
-                    elif age_seconds < 86400:
-                        age = f"{int(age_seconds / 3600)}h"
-                    else:
-                        age = f"{int(age_seconds / 86400)}d"
-
-                pod_list.append({
-                    "name": pod.metadata.name,
-                    "ready": ready,
-                    "status": status,
-                    "restarts": restart_count,
-                    "age": age,
-                    "node": pod.spec.node_name or "N/A",
-                })
+            pods = api.list_namespaced_pod(namespace=namespace)
+            pod_list = [_summarize_pod(pod) for pod in pods.items]
 
             return {
                 "pods": pod_list,
@@ -253,6 +353,91 @@ class KubernetesTools:
                 "error": f"Failed to list pods in namespace '{namespace}': {error_msg}"
             }
 
+    def list_pods_multi_namespace(
+        self,
+        context: str,
+        namespaces: Optional[list[str]] = None,
+        unhealthy_only: bool = True,
+    ) -> dict:
+        """
+        List pods across several namespaces (or the whole cluster) in one call.
+
+        With no namespaces, a single cluster-wide list request is made;
+        otherwise the namespaces are listed concurrently.
+
+        Args:
+            context: Kubernetes context name
+            namespaces: Namespaces to list (default: all namespaces)
+            unhealthy_only: Only return pods that are not Running and ready, or Succeeded
+
+        Returns:
+            Dictionary with pods grouped by namespace
+        """
+        expanded_path = os.path.expanduser(self.kubeconfig_path)
+
+        if not os.path.exists(expanded_path):
+            return {
+                "error": f"Kubeconfig not found at {expanded_path}. "
+                "Please ensure kubectl is configured."
+            }
+
+        # Client for the specified context
+        api = self._context_client(context)
+        if api is None:
+            return {"error": f"Failed to load context: {context}"}
+
+        try:
+            by_namespace = {}
+            if not namespaces:
+                pods = api.list_pod_for_all_namespaces()
+                for pod in pods.items:
+                    by_namespace.setdefault(pod.metadata.namespace, []).append(_summarize_pod(pod))
+            else:
+                namespaces = list(dict.fromkeys(namespaces))
+
+                def fetch(ns: str) -> list[dict]:
+                    pods = api.list_namespaced_pod(namespace=ns)
+                    return [_summarize_pod(pod) for pod in pods.items]
+
+                with ThreadPoolExecutor(max_workers=min(len(namespaces), _NAMESPACE_WORKERS)) as pool:
+                    by_namespace = dict(zip(namespaces, pool.map(fetch, namespaces)))
+
+            total = sum(len(pods) for pods in by_namespace.values())
+            if unhealthy_only:
+                by_namespace = {
+                    ns: [pod for pod in pods if _is_unhealthy(pod)]
+                    for ns, pods in by_namespace.items()
+                }
+                by_namespace = {ns: pods for ns, pods in by_namespace.items() if pods}
+
+            return {
+                "pods": by_namespace,
+                "count": sum(len(pods) for pods in by_namespace.values()),
+                "total_pods": total,
+                "unhealthy_only": unhealthy_only,
+                "context": context,
+            }
+
+        except Exception as e:
+            error_msg = str(e)
+
+            # Handle authentication errors
+            if "401" in error_msg or "unauthorized" in error_msg.lower():
+                return {
+                    "error": f"Authentication failed for context '{context}'. "
+                    "Please check your kubeconfig credentials."
+                }
+
+            # Handle permission errors
+            if "403" in error_msg or "forbidden" in error_msg.lower():
+                return {
+                    "error": "Permission denied to list pods. "
+                    "Please check your Kubernetes RBAC permissions."
+                }
+
+            # Generic error
+            return {"error": f"Failed to list pods in context '{context}': {error_msg}"}
+
     def get_pod_logs(
         self,
         context: str,
@@ -262,6 +447,8 @@ class KubernetesTools:
         tail_lines: int = 100,
         since_seconds: Optional[int] = None,
         previous: bool = False,
+        grep: Optional[str] = None,
+        limit_bytes: Optional[int] = _LOG_LIMIT_BYTES,
     ) -> dict:
         """
         Fetch logs from a pod in the specified cluster and namespace.
@@ -274,6 +461,8 @@ class KubernetesTools:
             tail_lines: Number of lines to retrieve (default: 100, max: 10000)
             since_seconds: Only return logs newer than N seconds
             previous: If True, get logs from previous container (for crashed pods)
+            grep: Only return lines matching this regular expression
+            limit_bytes: Maximum log bytes the API server returns (default: 1 MiB)
 
         Returns:
             Dictionary with logs and metadata
@@ -286,20 +475,49 @@ class KubernetesTools:
                 "Please ensure kubectl is configured."
             }
 
-        # Load the specified context
-        if not self._load_context(context):
+        # Client for the specified context
+        api = self._context_client(context)
+        if api is None:
             return {"error": f"Failed to load context: {context}"}
 
-        if not self._ensure_client():
-            return {"error": "Kubernetes client not configured"}
-
         # Enforce maximum tail lines
         tail_lines = min(tail_lines, 10000)
 
+        pattern = None
+        if grep:
+            try:
+                pattern = re.compile(grep)
+            except re.error as e:
+                return {"error": f"Invalid grep pattern '{grep}': {e}"}
+
+        return self._read_pod_logs(
+            api, context, namespace, pod_name, container_name, tail_lines, since_seconds, previous,
+            pattern, limit_bytes,
+        )
+
+    def _read_pod_logs(
+        self,
+        api: Any,
+        context: str,
+        namespace: str,
+        pod_name: str,
+        container_name: Optional[str],
+        tail_lines: int,
+        since_seconds: Optional[int],
+        previous: bool,
+        pattern: Optional[re.Pattern] = None,
+        limit_bytes: Optional[int] = _LOG_LIMIT_BYTES,
+    ) -> dict:
+        """
+        Read one pod's logs with the given context's client.
+
+        This does not touch kubeconfig, so it is safe to run for several pods
+        concurrently.
+        """
         try:
             # First, check if pod exists and get container info
             try:
-                pod = self._client.read_namespaced_pod(name=pod_name, namespace=namespace)
+                pod = api.read_namespaced_pod(name=pod_name, namespace=namespace)
             except Exception as e:
                 if "404" in str(e) or "not found" in str(e).lower():
                     return {
@@ -347,25 +565,37 @@ class KubernetesTools:
             if since_seconds:
                 kwargs["since_seconds"] = since_seconds
 
-            logs = self._client.read_namespaced_pod_log(**kwargs)
+            # Let the API server stop sending once the cap is reached
+            if limit_bytes:
+                kwargs["limit_bytes"] = limit_bytes
 
-            # Count lines and check if truncated
-            log_lines = logs.split("\n") if logs else []
-            line_count = len(log_lines)
+            if pattern is None:
+                logs = api.read_namespaced_pod_log(**kwargs)
 
-            return {
-                "logs": logs,
-                "metadata": {
-                    "pod": pod_name,
-                    "namespace": namespace,
-                    "context": context,
-                    "container": container_name,
-                    "lines": line_count,
-                    "tail_lines": tail_lines,
-                    "previous": previous,
-                    "truncated": line_count >= tail_lines,
-                },
+                # Count lines and check if truncated
+                log_lines = logs.split("\n") if logs else []
+                line_count = scanned = len(log_lines)
+                bytes_read = len(logs.encode("utf-8")) if logs else 0
+            else:
+                log_lines, scanned, bytes_read = self._grep_pod_log(api, kwargs, pattern)
+                logs = "\n".join(log_lines)
+                line_count = len(log_lines)
+
+            metadata = {
+                "pod": pod_name,
+                "namespace": namespace,
+                "context": context,
+                "container": container_name,
+                "lines": line_count,
+                "tail_lines": tail_lines,
+                "previous": previous,
+                "truncated": scanned >= tail_lines or bool(limit_bytes and bytes_read >= limit_bytes),
             }
+            if pattern is not None:
+                metadata["grep"] = pattern.pattern
+                metadata["lines_scanned"] = scanned
+
+            return {"logs": logs, "metadata": metadata}
 
         except Exception as e:
             error_msg = str(e)
@@ -396,3 +626,85 @@ class KubernetesTools:
                 "error": f"Failed to fetch logs from pod '{pod_name}' "
                 f"in namespace '{namespace}': {error_msg}"
             }
+
+    def find_and_fetch_logs(
+        self,
+        context: str,
+        namespace: str,
+        pod_name_pattern: str,
+        container_name: Optional[str] = None,
+        tail_lines: int = 100,
+        since_seconds: Optional[int] = None,
+        previous: bool = False,
+        max_pods: int = _MAX_LOG_PODS,
+    ) -> dict:
+        """
+        Find pods whose names match a pattern and fetch their logs in one call.
+
+        Saves the list-pods-then-fetch-logs round trip when the pod name is
+        already roughly known. Logs for the matched pods are fetched
+        concurrently.
+
+        Args:
+            context: Kubernetes context name
+            namespace: Namespace name
+            pod_name_pattern: Regular expression matched against pod names
+            container_name: Container name (required for multi-container pods)
+            tail_lines: Number of lines to retrieve per pod (default: 100, max: 10000)
+            since_seconds: Only return logs newer than N seconds
+            previous: If True, get logs from previous container (for crashed pods)
+            max_pods: Maximum matching pods to fetch logs for
+
+        Returns:
+            Dictionary with logs keyed by pod name and match metadata
+        """
+        expanded_path = os.path.expanduser(self.kubeconfig_path)
+
+        if not os.path.exists(expanded_path):
+            return {
+                "error": f"Kubeconfig not found at {expanded_path}. "
+                "Please ensure kubectl is configured."
+            }
+
+        try:
+            name_pattern = re.compile(pod_name_pattern)
+        except re.error as e:
+            return {"error": f"Invalid pod name pattern '{pod_name_pattern}': {e}"}
+
+        # The per-pod reads below share this context's client
+        api = self._context_client(context)
+        if api is None:
+            return {"error": f"Failed to load context: {context}"}
+
+        tail_lines = min(tail_lines, 10000)
+
+        try:
+            pods = api.list_namespaced_pod(namespace=namespace)
+        except Exception as e:
+            return {"error": f"Failed to list pods in namespace '{namespace}': {str(e)}"}
+
+        matched = sorted(
+            pod.metadata.name for pod in pods.items if name_pattern.search(pod.metadata.name)
+        )
+        if not matched:
+            return {
+                "error": f"No pods matching '{pod_name_pattern}' in namespace '{namespace}'."
+            }
+
+        selected = matched[:max(1, max_pods)]
+
+        def fetch(pod_name: str) -> dict:
+            return self._read_pod_logs(
+                api, context, namespace, pod_name, container_name, tail_lines, since_seconds, previous
+            )
+
+        with ThreadPoolExecutor(max_workers=min(len(selected), _LOG_FETCH_WORKERS)) as pool:
+            logs = dict(zip(selected, pool.map(fetch, selected)))
+
+        return {
+            "logs": logs,
+            "matched_pods": matched,
+            "fetched": len(selected),
+            "namespace": namespace,
+            "context": context,
+        }
@@ -4,8 +4,12 @@ LangChain tool wrappers for Datadog and PagerDuty.
 Converts the native tools to LangChain-compatible tools for use with LangGraph agents.
 """
 
-from typing import Optional, Type
-from pydantic import BaseModel, Field
+import asyncio
+import json
+import re
+import threading
+from typing import Any, ClassVar, Optional, Type
+from pydantic import BaseModel, Field, PrivateAttr
 from langchain_core.tools import BaseTool
 
 from tools.datadog_tools import DatadogTools
@@ -13,83 +17,226 @@ from tools.pagerduty_tools import PagerDutyTools
 from tools.kubernetes_tools import KubernetesTools
 from tools.sqs_tools import SQSTools
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# =============================================================================
+# Base Tool
+# =============================================================================
+
+# Held by tools with parallel_safe = False (PagerDuty writes)
+_WRITE_LOCK = threading.Lock()
+
+
+class _ThreadedTool(BaseTool):
+    """
+    BaseTool wrapping one integration client (DatadogTools, PagerDutyTools, ...).
+
+    Subclasses are declarative: name, description, args_schema and the
+    client `method` the tool forwards to. _run passes the validated
+    arguments straight through and serializes the result, so cross-cutting
+    behaviour (serialization, threading) lives here once. Override _format
+    to reshape a result before it is serialized.
+
+    The tool classes are defined once at import and the client is injected
+    per instance, so building an agent doesn't re-create (and re-validate)
+    tool classes.
+
+    datadog-api-client, pdpyras, kubernetes and boto3 are all blocking, so
+    _arun runs _run on a worker thread. An async graph run can then await
+    several tool calls from one turn concurrently without stalling the loop.
+
+    Tools that change external state set parallel_safe = False. Reads still
+    run concurrently; unsafe tools additionally take _WRITE_LOCK so two
+    writes from the same turn never interleave.
+    """
+
+    method: ClassVar[str]
+    parallel_safe: ClassVar[bool] = True
+    _client: Any = PrivateAttr(default=None)
+
+    def __init__(self, client: Any, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._client = client
+
+    def _format(self, result: dict) -> dict:
+        return result
+
+    def _run(self, **kwargs: Any) -> str:
+        call = getattr(self._client, self.method)
+        if self.parallel_safe:
+            result = call(**kwargs)
+        else:
+            with _WRITE_LOCK:
+                result = call(**kwargs)
+        return _dump(self._format(result))
+
+    async def _arun(self, *args: Any, **kwargs: Any) -> str:
+        return await asyncio.to_thread(self._run, *args, **kwargs)
+
+
+def _dump(result: Any) -> str:
+    """
+    Serialize a tool result as compact JSON for the LLM.
+
+    Valid JSON (double quotes, null/true/false) tokenizes better than a
+    Python repr. Uses orjson when installed, stdlib json otherwise; values
+    that aren't JSON types (datetimes, SDK models) fall back to str().
+    """
+    if orjson is not None:
+        return orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(result, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+# ANSI color codes and runs of blank lines carry no information for the LLM
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+
+
+def _compact(value: Any) -> Any:
+    """Recursively drop None and empty-string fields from dicts."""
+    if isinstance(value, dict):
+        return {k: _compact(v) for k, v in value.items() if v is not None and v != ""}
+    if isinstance(value, list):
+        return [_compact(v) for v in value]
+    return value
+
+
+def _compact_logs(result: dict) -> dict:
+    """Compact a get_pod_logs result and strip ANSI codes/blank lines from its logs."""
+    result = _compact(result)
+    if isinstance(result.get("logs"), str):
+        result["logs"] = _BLANK_LINES_RE.sub("\n", _ANSI_RE.sub("", result["logs"]))
+    return result
+
+
+# =============================================================================
+# Shared Field Factories
+# =============================================================================
+# Pydantic mutates FieldInfo objects while building a model, so instances
+# cannot be shared between fields. These factories only deduplicate the
+# repeated defaults and descriptions across the schemas below.
+
+_K8S_ENV_DESCRIPTION = "Environment: prod, stg, or dev (ask user if not specified)"
+
+
+def _required(description: str) -> Any:
+    """Required field."""
+    return Field(..., description=description)
+
+
+def _optional(description: str) -> Any:
+    """Optional field defaulting to None."""
+    return Field(None, description=description)
+
+
+def _limit(default: int, noun: str) -> Any:
+    """Result-count cap, e.g. "Maximum pods to return"."""
+    return Field(default, description=f"Maximum {noun} to return")
+
 
 # =============================================================================
 # Datadog Tool Schemas
 # =============================================================================
 
 class GetMonitorsInput(BaseModel):
-    status_filter: Optional[list[str]] = Field(None, description="Filter by status: 'Alert', 'Warn', 'OK', 'No Data'")
-    name_filter: Optional[str] = Field(None, description="Filter monitors by name")
-    limit: int = Field(50, description="Maximum monitors to return")
+    status_filter: Optional[list[str]] = _optional("Filter by status: 'Alert', 'Warn', 'OK', 'No Data'")
+    name_filter: Optional[str] = _optional("Filter monitors by name")
+    limit: int = _limit(50, "monitors")
 
 
 class GetMonitorDetailsInput(BaseModel):
-    monitor_id: int = Field(..., description="The Datadog monitor ID")
+    monitor_id: int = _required("The Datadog monitor ID")
 
 
 class QueryMetricsInput(BaseModel):
-    query: str = Field(..., description="Datadog metrics query (e.g., 'avg:system.cpu.user{*}')")
+    query: str = _required("Datadog metrics query (e.g., 'avg:system.cpu.user{*}')")
     from_time: str = Field("now-1h", description="Start time (e.g., 'now-1h')")
     to_time: str = Field("now", description="End time")
 
 
 class GetDashboardsInput(BaseModel):
-    name_filter: Optional[str] = Field(None, description="Filter dashboards by name")
-    limit: int = Field(20, description="Maximum dashboards to return")
+    name_filter: Optional[str] = _optional("Filter dashboards by name")
+    limit: int = _limit(20, "dashboards")
 
 
 class GetAPMServicesInput(BaseModel):
-    env: Optional[str] = Field(None, description="Filter by environment (e.g., 'prod')")
-    limit: int = Field(50, description="Maximum services to return")
+    env: Optional[str] = _optional("Filter by environment (e.g., 'prod')")
+    limit: int = _limit(50, "services")
 
 
 class GetServiceStatsInput(BaseModel):
-    service: str = Field(..., description="Service name")
-    env: Optional[str] = Field(None, description="Environment filter")
+    service: str = _required("Service name")
+    env: Optional[str] = _optional("Environment filter")
     from_time: str = Field("now-1h", description="Start time")
     to_time: str = Field("now", description="End time")
 
 
 class SearchTracesInput(BaseModel):
-    query: str = Field(..., description="Trace search query (e.g., 'service:api @duration:>1s')")
+    query: str = _required("Trace search query (e.g., 'service:api @duration:>1s')")
     from_time: str = Field("now-15m", description="Start time")
     to_time: str = Field("now", description="End time")
-    limit: int = Field(50, description="Maximum traces to return")
+    limit: int = _limit(50, "traces")
 
 
 class GetTraceDetailsInput(BaseModel):
-    trace_id: str = Field(..., description="The trace ID")
+    trace_id: str = _required("The trace ID")
+
+
+class SearchAndExpandTracesInput(BaseModel):
+    query: str = _required("Trace search query (e.g., 'service:api @duration:>1s')")
+    from_time: str = Field("now-15m", description="Start time")
+    to_time: str = Field("now", description="End time")
+    top_k: int = Field(3, description="Number of slowest traces to expand (max 10)")
 
 
 class GetK8sPodsInput(BaseModel):
-    env: Optional[str] = Field(None, description="Environment: prod, stg, or dev (ask user if not specified)")
-    cluster: Optional[str] = Field(None, description="Filter by cluster name")
-    namespace: Optional[str] = Field(None, description="Filter by namespace")
-    app: Optional[str] = Field(None, description="Filter by app/deployment name (e.g., 'mono', 'bumblebee')")
-    status: Optional[str] = Field(None, description="Filter by status: Running, Pending, Failed, CrashLoopBackOff")
-    limit: int = Field(50, description="Maximum pods to return")
+    env: Optional[str] = _optional(_K8S_ENV_DESCRIPTION)
+    cluster: Optional[str] = _optional("Filter by cluster name")
+    namespace: Optional[str] = _optional("Filter by namespace")
+    app: Optional[str] = _optional("Filter by app/deployment name (e.g., 'mono', 'bumblebee')")
+    status: Optional[str] = _optional("Filter by status: Running, Pending, Failed, CrashLoopBackOff")
+    limit: int = _limit(50, "pods")
+
+
+class GetK8sPodsMultiInput(BaseModel):
+    envs: list[str] = _required("Environments to query: prod, stg, dev")
+    namespace: Optional[str] = _optional("Filter by namespace")
+    app: Optional[str] = _optional("Filter by app/deployment name (e.g., 'mono', 'bumblebee')")
+    status: Optional[str] = _optional("Filter by status: Running, Pending, Failed, CrashLoopBackOff")
+    limit: int = _limit(50, "pods per environment")
 
 
 class GetK8sNodesInput(BaseModel):
-    env: Optional[str] = Field(None, description="Environment: prod, stg, or dev (ask user if not specified)")
-    cluster: Optional[str] = Field(None, description="Filter by cluster name")
-    limit: int = Field(50, description="Maximum nodes to return")
+    env: Optional[str] = _optional(_K8S_ENV_DESCRIPTION)
+    cluster: Optional[str] = _optional("Filter by cluster name")
+    limit: int = _limit(50, "nodes")
 
 
 class GetK8sDeploymentsInput(BaseModel):
-    env: Optional[str] = Field(None, description="Environment: prod, stg, or dev (ask user if not specified)")
-    cluster: Optional[str] = Field(None, description="Filter by cluster name")
-    namespace: Optional[str] = Field(None, description="Filter by namespace")
-    limit: int = Field(50, description="Maximum deployments to return")
+    env: Optional[str] = _optional(_K8S_ENV_DESCRIPTION)
+    cluster: Optional[str] = _optional("Filter by cluster name")
+    namespace: Optional[str] = _optional("Filter by namespace")
+    limit: int = _limit(50, "deployments")
 
 
 class GetK8sContainersInput(BaseModel):
-    env: Optional[str] = Field(None, description="Environment: prod, stg, or dev (ask user if not specified)")
-    cluster: Optional[str] = Field(None, description="Filter by cluster name")
-    namespace: Optional[str] = Field(None, description="Filter by namespace")
-    pod: Optional[str] = Field(None, description="Filter by pod name")
-    limit: int = Field(50, description="Maximum containers to return")
+    env: Optional[str] = _optional(_K8S_ENV_DESCRIPTION)
+    cluster: Optional[str] = _optional("Filter by cluster name")
+    namespace: Optional[str] = _optional("Filter by namespace")
+    pod: Optional[str] = _optional("Filter by pod name")
+    limit: int = _limit(50, "containers")
+
+
+class GetK8sSnapshotInput(BaseModel):
+    env: Optional[str] = _optional(_K8S_ENV_DESCRIPTION)
+    cluster: Optional[str] = _optional("Filter by cluster name")
+    namespace: Optional[str] = _optional("Filter by namespace")
+    pod: Optional[str] = _optional("Filter by pod name")
+    limit: int = _limit(50, "pods")
 
 
 # =============================================================================
@@ -97,38 +244,56 @@ class GetK8sContainersInput(BaseModel):
 # =============================================================================
 
 class GetPDIncidentsInput(BaseModel):
-    statuses: Optional[list[str]] = Field(None, description="Filter by status: 'triggered', 'acknowledged', 'resolved'")
-    urgency: Optional[str] = Field(None, description="Filter by urgency: 'high', 'low'")
-    limit: int = Field(25, description="Maximum incidents to return")
+    statuses: Optional[list[str]] = _optional("Filter by status: 'triggered', 'acknowledged', 'resolved'")
+    urgency: Optional[str] = _optional("Filter by urgency: 'high', 'low'")
+    limit: int = _limit(25, "incidents")
+    columnar: bool = Field(False, description="Return per-field columns instead of one object per incident (compact for large listings)")
 
 
 class GetPDIncidentDetailsInput(BaseModel):
-    incident_id: str = Field(..., description="PagerDuty incident ID")
+    incident_id: str = _required("PagerDuty incident ID")
+    include_timeline: bool = Field(False, description="Also fetch the last 20 log entries (extra API call)")
 
 
 class GetOncallInput(BaseModel):
-    schedule_ids: Optional[list[str]] = Field(None, description="Filter by schedule IDs")
-    escalation_policy_ids: Optional[list[str]] = Field(None, description="Filter by escalation policy IDs")
+    schedule_ids: Optional[list[str]] = _optional("Filter by schedule IDs")
+    escalation_policy_ids: Optional[list[str]] = _optional("Filter by escalation policy IDs")
 
 
 class GetPDServicesInput(BaseModel):
-    name_filter: Optional[str] = Field(None, description="Filter services by name")
-    limit: int = Field(50, description="Maximum services to return")
+    name_filter: Optional[str] = _optional("Filter services by name")
+    team_ids: Optional[list[str]] = _optional("Only return services owned by these team IDs")
+    limit: int = _limit(50, "services")
+    fresh: bool = Field(False, description="Skip the 30s cache and fetch live data")
 
 
 class AcknowledgeIncidentInput(BaseModel):
-    incident_id: str = Field(..., description="PagerDuty incident ID to acknowledge")
+    incident_id: str = _required("PagerDuty incident ID to acknowledge")
 
 
 class ResolveIncidentInput(BaseModel):
-    incident_id: str = Field(..., description="PagerDuty incident ID to resolve")
-    resolution: Optional[str] = Field(None, description="Resolution note")
+    incident_id: str = _required("PagerDuty incident ID to resolve")
+    resolution: Optional[str] = _optional("Resolution note")
+
+
+class AcknowledgeIncidentsBulkInput(BaseModel):
+    incident_ids: list[str] = _required("PagerDuty incident IDs to acknowledge")
+
+
+class ResolveIncidentsBulkInput(BaseModel):
+    incident_ids: list[str] = _required("PagerDuty incident IDs to resolve")
+    resolution: Optional[str] = _optional("Resolution note applied to every incident")
 
 
 class GetRecentAlertsInput(BaseModel):
-    service_id: Optional[str] = Field(None, description="Filter by service ID")
+    service_id: Optional[str] = _optional("Filter by service ID")
     since_hours: int = Field(24, description="Look back this many hours")
-    limit: int = Field(50, description="Maximum alerts to return")
+    limit: int = _limit(50, "alerts")
+
+
+class GetPDDashboardInput(BaseModel):
+    incident_limit: int = _limit(25, "active incidents")
+    service_limit: int = _limit(50, "services")
 
 
 # =============================================================================
@@ -141,21 +306,38 @@ class GetK8sContextsInput(BaseModel):
 
 
 class GetK8sNamespacesInput(BaseModel):
-    context: str = Field(..., description="Kubernetes context name")
+    context: str = _required("Kubernetes context name")
 
 
 class ListPodsInput(BaseModel):
-    context: str = Field(..., description="Kubernetes context name")
-    namespace: str = Field(..., description="Namespace name")
+    context: str = _required("Kubernetes context name")
+    namespace: str = _required("Namespace name")
+
+
+class ListPodsMultiNamespaceInput(BaseModel):
+    context: str = _required("Kubernetes context name")
+    namespaces: Optional[list[str]] = _optional("Namespaces to list (default: all namespaces)")
+    unhealthy_only: bool = Field(True, description="Only return pods that are not Running and ready (default: true)")
 
 
 class GetPodLogsInput(BaseModel):
-    context: str = Field(..., description="Kubernetes context name")
-    namespace: str = Field(..., description="Namespace name")
-    pod_name: str = Field(..., description="Pod name")
-    container_name: Optional[str] = Field(None, description="Container name (required for multi-container pods)")
+    context: str = _required("Kubernetes context name")
+    namespace: str = _required("Namespace name")
+    pod_name: str = _required("Pod name")
+    container_name: Optional[str] = _optional("Container name (required for multi-container pods)")
     tail_lines: int = Field(100, description="Number of lines to retrieve (default: 100, max: 10000)")
-    since_seconds: Optional[int] = Field(None, description="Only return logs newer than N seconds")
+    since_seconds: Optional[int] = _optional("Only return logs newer than N seconds")
+    previous: bool = Field(False, description="If True, get logs from previous container (for crashed pods)")
+    grep: Optional[str] = _optional("Only return lines matching this regex (e.g., 'ERROR|Exception')")
+
+
+class FindAndFetchLogsInput(BaseModel):
+    context: str = _required("Kubernetes context name")
+    namespace: str = _required("Namespace name")
+    pod_name_pattern: str = _required("Regex matched against pod names (e.g., '^checkout-')")
+    container_name: Optional[str] = _optional("Container name (required for multi-container pods)")
+    tail_lines: int = Field(100, description="Number of lines to retrieve per pod (default: 100, max: 10000)")
+    since_seconds: Optional[int] = _optional("Only return logs newer than N seconds")
     previous: bool = Field(False, description="If True, get logs from previous container (for crashed pods)")
 
 
@@ -164,260 +346,367 @@ class GetPodLogsInput(BaseModel):
 # =============================================================================
 
 class SQSListQueuesInput(BaseModel):
-    queue_name_prefix: Optional[str] = Field(None, description="Filter queues by name prefix")
-    max_results: int = Field(100, description="Maximum queues to return (max: 1000)")
+    queue_name_prefix: Optional[str] = _optional("Filter queues by name prefix")
+    max_results: int = Field(100, description="Maximum queues to return")
 
 
 class SQSGetQueueAttributesInput(BaseModel):
-    queue_url: str = Field(..., description="SQS queue URL")
+    queue_url: str = _required("SQS queue URL")
+    fresh: bool = Field(False, description="Skip the 10s cache and fetch live data")
+
+
+class SQSBatchGetQueueAttributesInput(BaseModel):
+    queue_urls: list[str] = _required("SQS queue URLs")
+
+
+class SQSFindDLQsInput(BaseModel):
+    queue_name_prefix: Optional[str] = _optional("Only scan queues with this name prefix")
+    min_messages: int = Field(1, description="Minimum message count to report a DLQ")
 
 
 class SQSPeekMessagesInput(BaseModel):
-    queue_url: str = Field(..., description="SQS queue URL")
+    queue_url: str = _required("SQS queue URL")
     max_messages: int = Field(10, description="Maximum messages to peek at (1-10)")
-    wait_time_seconds: int = Field(0, description="Long polling wait time (0-20 seconds)")
+    wait_time_seconds: int = Field(1, description="Long polling wait time (0-20 seconds)")
+    include_raw: bool = Field(False, description="Also return the raw text of JSON message bodies")
+    max_body_chars: int = Field(1000, description="Truncate raw/non-JSON bodies to this many characters")
+
+
+class SQSBatchPeekMessagesInput(BaseModel):
+    queue_urls: list[str] = _required("SQS queue URLs")
+    max_messages: int = Field(10, description="Maximum messages to peek at per queue (1-10)")
 
 
 class SQSGetQueueUrlInput(BaseModel):
-    queue_name: str = Field(..., description="Name of the SQS queue")
-    account_id: Optional[str] = Field(None, description="AWS account ID (for cross-account access)")
+    queue_name: str = _required("Name of the SQS queue")
+    account_id: Optional[str] = _optional("AWS account ID (for cross-account access)")
 
 
 # =============================================================================
-# LangChain Tool Classes
+# Datadog Tools
 # =============================================================================
 
-def create_datadog_tools(dd: DatadogTools) -> list[BaseTool]:
-    """Create LangChain tools for Datadog APM (Application Performance Monitoring) only."""
+class GetAPMServicesTool(_ThreadedTool):
+    name: str = "datadog_get_apm_services"
+    description: str = "List APM services with request counts. See all instrumented services and traffic levels."
+    args_schema: Type[BaseModel] = GetAPMServicesInput
+    method: ClassVar[str] = "get_apm_services"
+
+
+class GetServiceStatsTool(_ThreadedTool):
+    name: str = "datadog_get_service_stats"
+    description: str = "Get APM statistics for a service: latency (avg/p95/p99), throughput, error rate. Use for performance investigation."
+    args_schema: Type[BaseModel] = GetServiceStatsInput
+    method: ClassVar[str] = "get_service_stats"
+
+
+class SearchTracesTool(_ThreadedTool):
+    name: str = "datadog_search_traces"
+    description: str = "Search APM traces by service, duration, or errors. Find slow requests or investigate endpoints."
+    args_schema: Type[BaseModel] = SearchTracesInput
+    method: ClassVar[str] = "search_traces"
+
 
-    class GetAPMServicesTool(BaseTool):
-        name: str = "datadog_get_apm_services"
-        description: str = "List APM services with request counts. See all instrumented services and traffic levels."
-        args_schema: Type[BaseModel] = GetAPMServicesInput
+class GetTraceDetailsTool(_ThreadedTool):
+    name: str = "datadog_get_trace_details"
+    description: str = "Get detailed trace information including all spans. Drill down to identify bottlenecks."
+    args_schema: Type[BaseModel] = GetTraceDetailsInput
+    method: ClassVar[str] = "get_trace_details"
 
-        def _run(self, env: str = None, limit: int = 50) -> str:
-            result = dd.get_apm_services(env=env, limit=limit)
-            return str(result)
+    def _format(self, result: dict) -> dict:
+        return _compact(result)
 
-    class GetServiceStatsTool(BaseTool):
-        name: str = "datadog_get_service_stats"
-        description: str = "Get APM statistics for a service: latency (avg/p95/p99), throughput, error rate. Use for performance investigation."
-        args_schema: Type[BaseModel] = GetServiceStatsInput
 
-        def _run(self, service: str, env: str = None, from_time: str = "now-1h", to_time: str = "now") -> str:
-            result = dd.get_service_stats(service=service, env=env, from_time=from_time, to_time=to_time)
-            return str(result)
+class SearchAndExpandTracesTool(_ThreadedTool):
+    name: str = "datadog_search_and_expand_traces"
+    description: str = "Search traces and return full details for the slowest matches in one call. Prefer this for latency investigations."
+    args_schema: Type[BaseModel] = SearchAndExpandTracesInput
+    method: ClassVar[str] = "search_and_expand_traces"
 
-    class SearchTracesTool(BaseTool):
-        name: str = "datadog_search_traces"
-        description: str = "Search APM traces by service, duration, or errors. Find slow requests or investigate endpoints."
-        args_schema: Type[BaseModel] = SearchTracesInput
+    def _format(self, result: dict) -> dict:
+        return _compact(result)
 
-        def _run(self, query: str, from_time: str = "now-15m", to_time: str = "now", limit: int = 50) -> str:
-            result = dd.search_traces(query=query, from_time=from_time, to_time=to_time, limit=limit)
-            return str(result)
 
-    class GetTraceDetailsTool(BaseTool):
-        name: str = "datadog_get_trace_details"
-        description: str = "Get detailed trace information including all spans. Drill down to identify bottlenecks."
-        args_schema: Type[BaseModel] = GetTraceDetailsInput
+class GetK8sPodsMultiEnvTool(_ThreadedTool):
+    name: str = "datadog_get_k8s_pods_multi_env"
+    description: str = "Get Kubernetes pod status from Datadog for several environments at once (queried in parallel). Use to compare prod/stg/dev."
+    args_schema: Type[BaseModel] = GetK8sPodsMultiInput
+    method: ClassVar[str] = "get_k8s_pods_multi_env"
 
-        def _run(self, trace_id: str) -> str:
-            result = dd.get_trace_details(trace_id=trace_id)
-            return str(result)
 
-    # Only APM tools - other Datadog features removed for simplicity
-    return [
-        GetAPMServicesTool(),
-        GetServiceStatsTool(),
-        SearchTracesTool(),
-        GetTraceDetailsTool(),
-    ]
+class BulkK8sSnapshotTool(_ThreadedTool):
+    name: str = "datadog_get_k8s_snapshot"
+    description: str = "Get pod phase, restarts, CPU and memory vs limits from Datadog in one call. Prefer this for crashing or OOMing pods."
+    args_schema: Type[BaseModel] = GetK8sSnapshotInput
+    method: ClassVar[str] = "bulk_k8s_snapshot"
+
+
+# =============================================================================
+# PagerDuty Tools
+# =============================================================================
+
+class GetIncidentsTool(_ThreadedTool):
+    name: str = "pagerduty_get_incidents"
+    description: str = "List PagerDuty incidents. Check active incidents, urgency, and assignments."
+    args_schema: Type[BaseModel] = GetPDIncidentsInput
+    method: ClassVar[str] = "get_incidents"
+
+
+class GetIncidentDetailsTool(_ThreadedTool):
+    name: str = "pagerduty_get_incident_details"
+    description: str = "Get detailed PagerDuty incident info: first trigger, acknowledgers, notes and optional timeline."
+    args_schema: Type[BaseModel] = GetPDIncidentDetailsInput
+    method: ClassVar[str] = "get_incident_details"
+
+
+class GetOncallTool(_ThreadedTool):
+    name: str = "pagerduty_get_oncall"
+    description: str = "Get current on-call users. Find who is responsible for incidents or services."
+    args_schema: Type[BaseModel] = GetOncallInput
+    method: ClassVar[str] = "get_oncall"
+
+
+class GetServicesTool(_ThreadedTool):
+    name: str = "pagerduty_get_services"
+    description: str = "List PagerDuty services and their status."
+    args_schema: Type[BaseModel] = GetPDServicesInput
+    method: ClassVar[str] = "get_services"
+
+
+class AcknowledgeIncidentTool(_ThreadedTool):
+    name: str = "pagerduty_acknowledge_incident"
+    description: str = "Acknowledge a PagerDuty incident. Use when starting to work on an incident."
+    args_schema: Type[BaseModel] = AcknowledgeIncidentInput
+    method: ClassVar[str] = "acknowledge_incident"
+    parallel_safe: ClassVar[bool] = False
+
+
+class ResolveIncidentTool(_ThreadedTool):
+    name: str = "pagerduty_resolve_incident"
+    description: str = "Resolve a PagerDuty incident. Use when an incident is fixed."
+    args_schema: Type[BaseModel] = ResolveIncidentInput
+    method: ClassVar[str] = "resolve_incident"
+    parallel_safe: ClassVar[bool] = False
+
+
+class AcknowledgeIncidentsBulkTool(_ThreadedTool):
+    name: str = "pagerduty_acknowledge_incidents"
+    description: str = "Acknowledge several PagerDuty incidents in one request."
+    args_schema: Type[BaseModel] = AcknowledgeIncidentsBulkInput
+    method: ClassVar[str] = "acknowledge_incidents"
+    parallel_safe: ClassVar[bool] = False
+
+
+class ResolveIncidentsBulkTool(_ThreadedTool):
+    name: str = "pagerduty_resolve_incidents"
+    description: str = "Resolve several PagerDuty incidents in one request."
+    args_schema: Type[BaseModel] = ResolveIncidentsBulkInput
+    method: ClassVar[str] = "resolve_incidents"
+    parallel_safe: ClassVar[bool] = False
+
+
+class GetRecentAlertsTool(_ThreadedTool):
+    name: str = "pagerduty_get_recent_alerts"
+    description: str = "Get recent alerts/triggers from PagerDuty. See what alerts have fired recently."
+    args_schema: Type[BaseModel] = GetRecentAlertsInput
+    method: ClassVar[str] = "get_recent_alerts"
+
+
+class GetDashboardTool(_ThreadedTool):
+    name: str = "pagerduty_get_dashboard"
+    description: str = "Get active incidents, on-call, and service status in one call. Use for an overall PagerDuty picture."
+    args_schema: Type[BaseModel] = GetPDDashboardInput
+    method: ClassVar[str] = "dashboard_snapshot"
+
+
+# =============================================================================
+# Kubernetes Tools
+# =============================================================================
+
+class GetContextsTool(_ThreadedTool):
+    name: str = "k8s_get_contexts"
+    description: str = "List available Kubernetes cluster contexts from local kubeconfig. Use to see which clusters are available."
+    args_schema: Type[BaseModel] = GetK8sContextsInput
+    method: ClassVar[str] = "get_contexts"
+
+
+class GetNamespacesTool(_ThreadedTool):
+    name: str = "k8s_get_namespaces"
+    description: str = "List namespaces in a Kubernetes cluster. Use after selecting a cluster context to see available namespaces."
+    args_schema: Type[BaseModel] = GetK8sNamespacesInput
+    method: ClassVar[str] = "get_namespaces"
+
+
+class ListPodsTool(_ThreadedTool):
+    name: str = "k8s_list_pods"
+    description: str = "List all pods in a namespace with their status, restarts, and age. Use this to see what pods are running before fetching logs."
+    args_schema: Type[BaseModel] = ListPodsInput
+    method: ClassVar[str] = "list_pods"
+
+
+class ListPodsMultiNamespaceTool(_ThreadedTool):
+    name: str = "k8s_list_pods_multi_namespace"
+    description: str = "List pods across several namespaces or the whole cluster in one call, by default only unhealthy ones (not Running/ready, incl. CrashLoopBackOff). Use for cluster-wide triage instead of k8s_list_pods per namespace."
+    args_schema: Type[BaseModel] = ListPodsMultiNamespaceInput
+    method: ClassVar[str] = "list_pods_multi_namespace"
+
+
+class GetPodLogsTool(_ThreadedTool):
+    name: str = "k8s_get_pod_logs"
+    description: str = "Fetch logs from a pod in real-time (no Datadog lag). For crashed pods, use previous=true. For multi-container pods, specify container_name."
+    args_schema: Type[BaseModel] = GetPodLogsInput
+    method: ClassVar[str] = "get_pod_logs"
+
+    def _format(self, result: dict) -> dict:
+        return _compact_logs(result)
+
+
+class FindAndFetchLogsTool(_ThreadedTool):
+    name: str = "k8s_find_and_fetch_logs"
+    description: str = "Find pods whose names match a pattern and fetch their logs in one step (up to 5 pods, fetched in parallel). Use instead of k8s_list_pods + k8s_get_pod_logs when you know roughly which pod you want."
+    args_schema: Type[BaseModel] = FindAndFetchLogsInput
+    method: ClassVar[str] = "find_and_fetch_logs"
+
+    def _format(self, result: dict) -> dict:
+        if isinstance(result.get("logs"), dict):
+            result["logs"] = {pod: _compact_logs(logs) for pod, logs in result["logs"].items()}
+        return result
+
+
+# =============================================================================
+# SQS Tools
+# =============================================================================
+
+class ListQueuesTool(_ThreadedTool):
+    name: str = "sqs_list_queues"
+    description: str = "List AWS SQS queues. Discover available queues or find by name prefix."
+    args_schema: Type[BaseModel] = SQSListQueuesInput
+    method: ClassVar[str] = "list_queues"
+
+
+class GetQueueAttributesTool(_ThreadedTool):
+    name: str = "sqs_get_queue_attributes"
+    description: str = "Get queue attributes: message counts, visibility timeout, DLQ config."
+    args_schema: Type[BaseModel] = SQSGetQueueAttributesInput
+    method: ClassVar[str] = "get_queue_attributes"
+
+
+class BatchGetQueueAttributesTool(_ThreadedTool):
+    name: str = "sqs_get_queue_attributes_batch"
+    description: str = "Get attributes for several queues in one call (fetched in parallel). Use instead of repeated sqs_get_queue_attributes, e.g. across DLQs."
+    args_schema: Type[BaseModel] = SQSBatchGetQueueAttributesInput
+    method: ClassVar[str] = "get_queue_attributes_many"
+
+
+class FindDLQsWithMessagesTool(_ThreadedTool):
+    name: str = "sqs_find_dlqs_with_messages"
+    description: str = "Find dead-letter queues that currently hold messages, with message counts (unreadable DLQs listed under errors). Use first when investigating failed processing."
+    args_schema: Type[BaseModel] = SQSFindDLQsInput
+    method: ClassVar[str] = "find_dlqs_with_messages"
+
+
+class PeekMessagesTool(_ThreadedTool):
+    name: str = "sqs_peek_messages"
+    description: str = "Peek at messages WITHOUT removing them (read-only). Messages stay in queue for other consumers."
+    args_schema: Type[BaseModel] = SQSPeekMessagesInput
+    method: ClassVar[str] = "peek_messages"
+
+
+class BatchPeekMessagesTool(_ThreadedTool):
+    name: str = "sqs_peek_messages_batch"
+    description: str = "Peek at messages in several queues at once WITHOUT removing them (read-only, parallel)."
+    args_schema: Type[BaseModel] = SQSBatchPeekMessagesInput
+    method: ClassVar[str] = "peek_messages_many"
+
+
+class GetQueueUrlTool(_ThreadedTool):
+    name: str = "sqs_get_queue_url"
+    description: str = "Get the URL of a queue by its name. Useful when you know the name but need the full URL."
+    args_schema: Type[BaseModel] = SQSGetQueueUrlInput
+    method: ClassVar[str] = "get_queue_url"
+
+
+# =============================================================================
+# Tool Factories
+# =============================================================================
+
+# APM tools plus the multi-environment and combined K8s pod views - other
+# Datadog features removed for simplicity
+_DATADOG_TOOL_CLASSES = (
+    GetAPMServicesTool,
+    GetServiceStatsTool,
+    SearchTracesTool,
+    GetTraceDetailsTool,
+    SearchAndExpandTracesTool,
+    GetK8sPodsMultiEnvTool,
+    BulkK8sSnapshotTool,
+)
+
+_PAGERDUTY_TOOL_CLASSES = (
+    GetIncidentsTool,
+    GetIncidentDetailsTool,
+    GetOncallTool,
+    GetServicesTool,
+    AcknowledgeIncidentTool,
+    ResolveIncidentTool,
+    AcknowledgeIncidentsBulkTool,
+    ResolveIncidentsBulkTool,
+    GetRecentAlertsTool,
+    GetDashboardTool,
+)
+
+_KUBERNETES_TOOL_CLASSES = (
+    GetContextsTool,
+    GetNamespacesTool,
+    ListPodsTool,
+    ListPodsMultiNamespaceTool,
+    GetPodLogsTool,
+    FindAndFetchLogsTool,
+)
+
+_SQS_TOOL_CLASSES = (
+    ListQueuesTool,
+    GetQueueAttributesTool,
+    BatchGetQueueAttributesTool,
+    FindDLQsWithMessagesTool,
+    PeekMessagesTool,
+    BatchPeekMessagesTool,
+    GetQueueUrlTool,
+)
+
+
+def _cached_tools(client: Any, tool_classes: tuple[type[BaseTool], ...]) -> list[BaseTool]:
+    """
+    Return the tools for this client instance, building them on first use.
+
+    The integration dataclasses compare by value and are therefore
+    unhashable, which rules out functools.cache. The built tuple is stored
+    on the client itself instead, so it is freed together with the client
+    (slotted clients declare a _langchain_tools field for it). A fresh
+    list is returned so callers can extend it freely.
+    """
+    tools = getattr(client, "_langchain_tools", None)
+    if tools is None:
+        tools = tuple(cls(client) for cls in tool_classes)
+        client._langchain_tools = tools
+    return list(tools)
+
+
+def create_datadog_tools(dd: DatadogTools) -> list[BaseTool]:
+    """Create LangChain tools for Datadog APM (Application Performance Monitoring) only."""
+    return _cached_tools(dd, _DATADOG_TOOL_CLASSES)
 
 
 def create_pagerduty_tools(pd: PagerDutyTools) -> list[BaseTool]:
     """Create LangChain tools for PagerDuty."""
-
-    class GetIncidentsTool(BaseTool):
-        name: str = "pagerduty_get_incidents"
-        description: str = "List PagerDuty incidents. Check active incidents, urgency, and assignments."
-        args_schema: Type[BaseModel] = GetPDIncidentsInput
-
-        def _run(self, statuses: list[str] = None, urgency: str = None, limit: int = 25) -> str:
-            result = pd.get_incidents(statuses=statuses, urgency=urgency, limit=limit)
-            return str(result)
-
-    class GetIncidentDetailsTool(BaseTool):
-        name: str = "pagerduty_get_incident_details"
-        description: str = "Get detailed PagerDuty incident info including timeline and notes."
-        args_schema: Type[BaseModel] = GetPDIncidentDetailsInput
-
-        def _run(self, incident_id: str) -> str:
-            result = pd.get_incident_details(incident_id=incident_id)
-            return str(result)
-
-    class GetOncallTool(BaseTool):
-        name: str = "pagerduty_get_oncall"
-        description: str = "Get current on-call users. Find who is responsible for incidents or services."
-        args_schema: Type[BaseModel] = GetOncallInput
-
-        def _run(self, schedule_ids: list[str] = None, escalation_policy_ids: list[str] = None) -> str:
-            result = pd.get_oncall(schedule_ids=schedule_ids, escalation_policy_ids=escalation_policy_ids)
-            return str(result)
-
-    class GetServicesTool(BaseTool):
-        name: str = "pagerduty_get_services"
-        description: str = "List PagerDuty services and their status."
-        args_schema: Type[BaseModel] = GetPDServicesInput
-
-        def _run(self, name_filter: str = None, limit: int = 50) -> str:
-            result = pd.get_services(name_filter=name_filter, limit=limit)
-            return str(result)
-
-    class AcknowledgeIncidentTool(BaseTool):
-        name: str = "pagerduty_acknowledge_incident"
-        description: str = "Acknowledge a PagerDuty incident. Use when starting to work on an incident."
-        args_schema: Type[BaseModel] = AcknowledgeIncidentInput
-
-        def _run(self, incident_id: str) -> str:
-            result = pd.acknowledge_incident(incident_id=incident_id)
-            return str(result)
-
-    class ResolveIncidentTool(BaseTool):
-        name: str = "pagerduty_resolve_incident"
-        description: str = "Resolve a PagerDuty incident. Use when an incident is fixed."
-        args_schema: Type[BaseModel] = ResolveIncidentInput
-
-        def _run(self, incident_id: str, resolution: str = None) -> str:
-            result = pd.resolve_incident(incident_id=incident_id, resolution=resolution)
-            return str(result)
-
-    class GetRecentAlertsTool(BaseTool):
-        name: str = "pagerduty_get_recent_alerts"
-        description: str = "Get recent alerts/triggers from PagerDuty. See what alerts have fired recently."
-        args_schema: Type[BaseModel] = GetRecentAlertsInput
-
-        def _run(self, service_id: str = None, since_hours: int = 24, limit: int = 50) -> str:
-            result = pd.get_recent_alerts(service_id=service_id, since_hours=since_hours, limit=limit)
-            return str(result)
-
-    return [
-        GetIncidentsTool(),
-        GetIncidentDetailsTool(),
-        GetOncallTool(),
-        GetServicesTool(),
-        AcknowledgeIncidentTool(),
-        ResolveIncidentTool(),
-        GetRecentAlertsTool(),
-    ]
+    return _cached_tools(pd, _PAGERDUTY_TOOL_CLASSES)
 
 
 def create_kubernetes_tools(k8s: KubernetesTools) -> list[BaseTool]:
     """Create LangChain tools for Kubernetes."""
-
-    class GetContextsTool(BaseTool):
-        name: str = "k8s_get_contexts"
-        description: str = "List available Kubernetes cluster contexts from local kubeconfig. Use to see which clusters are available."
-        args_schema: Type[BaseModel] = GetK8sContextsInput
-
-        def _run(self) -> str:
-            result = k8s.get_contexts()
-            return str(result)
-
-    class GetNamespacesTool(BaseTool):
-        name: str = "k8s_get_namespaces"
-        description: str = "List namespaces in a Kubernetes cluster. Use after selecting a cluster context to see available namespaces."
-        args_schema: Type[BaseModel] = GetK8sNamespacesInput
-
-        def _run(self, context: str) -> str:
-            result = k8s.get_namespaces(context=context)
-            return str(result)
-
-    class ListPodsTool(BaseTool):
-        name: str = "k8s_list_pods"
-        description: str = "List all pods in a namespace with their status, restarts, and age. Use this to see what pods are running before fetching logs."
-        args_schema: Type[BaseModel] = ListPodsInput
-
-        def _run(self, context: str, namespace: str) -> str:
-            result = k8s.list_pods(context=context, namespace=namespace)
-            return str(result)
-
-    class GetPodLogsTool(BaseTool):
-        name: str = "k8s_get_pod_logs"
-        description: str = "Fetch logs from a pod in real-time (no Datadog lag). For crashed pods, use previous=true. For multi-container pods, specify container_name."
-        args_schema: Type[BaseModel] = GetPodLogsInput
-
-        def _run(
-            self,
-            context: str,
-            namespace: str,
-            pod_name: str,
-            container_name: str = None,
-            tail_lines: int = 100,
-            since_seconds: int = None,
-            previous: bool = False,
-        ) -> str:
-            result = k8s.get_pod_logs(
-                context=context,
-                namespace=namespace,
-                pod_name=pod_name,
-                container_name=container_name,
-                tail_lines=tail_lines,
-                since_seconds=since_seconds,
-                previous=previous,
-            )
-            return str(result)
-
-    return [
-        GetContextsTool(),
-        GetNamespacesTool(),
-        ListPodsTool(),
-        GetPodLogsTool(),
-    ]
+    return _cached_tools(k8s, _KUBERNETES_TOOL_CLASSES)
 
 
 def create_sqs_tools(sqs: SQSTools) -> list[BaseTool]:
     """Create LangChain tools for AWS SQS (read-only)."""
-
-    class ListQueuesTool(BaseTool):
-        name: str = "sqs_list_queues"
-        description: str = "List AWS SQS queues. Discover available queues or find by name prefix."
-        args_schema: Type[BaseModel] = SQSListQueuesInput
-
-        def _run(self, queue_name_prefix: str = None, max_results: int = 100) -> str:
-            result = sqs.list_queues(queue_name_prefix=queue_name_prefix, max_results=max_results)
-            return str(result)
-
-    class GetQueueAttributesTool(BaseTool):
-        name: str = "sqs_get_queue_attributes"
-        description: str = "Get queue attributes: message counts, age of oldest message, visibility timeout, DLQ config."
-        args_schema: Type[BaseModel] = SQSGetQueueAttributesInput
-
-        def _run(self, queue_url: str) -> str:
-            result = sqs.get_queue_attributes(queue_url=queue_url)
-            return str(result)
-
-    class PeekMessagesTool(BaseTool):
-        name: str = "sqs_peek_messages"
-        description: str = "Peek at messages WITHOUT removing them (read-only). Messages stay in queue for other consumers."
-        args_schema: Type[BaseModel] = SQSPeekMessagesInput
-
-        def _run(self, queue_url: str, max_messages: int = 10, wait_time_seconds: int = 0) -> str:
-            result = sqs.peek_messages(queue_url=queue_url, max_messages=max_messages, wait_time_seconds=wait_time_seconds)
-            return str(result)
-
-    class GetQueueUrlTool(BaseTool):
-        name: str = "sqs_get_queue_url"
-        description: str = "Get the URL of a queue by its name. Useful when you know the name but need the full URL."
-        args_schema: Type[BaseModel] = SQSGetQueueUrlInput
-
-        def _run(self, queue_name: str, account_id: str = None) -> str:
-            result = sqs.get_queue_url(queue_name=queue_name, account_id=account_id)
-            return str(result)
-
-    return [
-        ListQueuesTool(),
-        GetQueueAttributesTool(),
-        PeekMessagesTool(),
-        GetQueueUrlTool(),
-    ]
+    return _cached_tools(sqs, _SQS_TOOL_CLASSES)
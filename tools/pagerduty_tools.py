@@ -9,9 +9,122 @@ Provides tools for:
 - Listing recent alerts
 """
 
-from dataclasses import dataclass
-from typing import Any, Optional
-from datetime import datetime, timedelta
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from threading import Lock
+import re
+from typing import Any, Callable, Optional
+
+from tools.cache import SingleFlight, TTLCache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Default lifetime (seconds) of cached PagerDuty responses
+_CACHE_TTL = 60
+
+# Per-endpoint TTLs (seconds) for _cached_call. Incidents change quickly, so
+# their entry only absorbs repeat calls within one agent turn.
+_ONCALL_TTL = 30
+_SERVICES_TTL = 30
+_INCIDENTS_TTL = 5
+
+# Oldest cached response (seconds) _cached_call falls back to when PagerDuty
+# is failing; beyond this an error is more useful than outdated incidents
+_MAX_STALE_AGE = 900
+
+# Maximum incidents PagerDuty accepts in one PUT /incidents request
+_BULK_UPDATE_MAX = 250
+
+# Largest page size the PagerDuty list endpoints accept
+_MAX_PAGE_SIZE = 100
+
+# Classic pagination stops at offset 10000; larger limits cannot be served
+_MAX_LIST_RESULTS = 10000
+
+# Concurrent page requests in _parallel_fetch. Kept small so a burst stays
+# well under PagerDuty's per-key rate limit; pdpyras backs off on 429.
+_PAGE_FETCH_WORKERS = 4
+
+# Keep-alive connections held open to api.pagerduty.com; sized for the
+# parallel tool calls of one agent turn plus _parallel_fetch page workers
+_CONNECTION_POOL_MAXSIZE = 32
+
+# Extra attempts pdpyras makes on transient gateway errors (it already
+# retries 429 with backoff on its own)
+_HTTP_RETRY = {502: 3, 503: 3, 504: 3}
+
+# Classifies error messages in one pass: group 1 matches authentication
+# failures, group 2 permission failures. Whole words only (4010 is not a
+# 401), but a glued "HTTP401" still counts.
+_AUTH_ERROR_RE = re.compile(r"\b(?:http)?(?:(401|unauthorized|authentication)|(403|forbidden))\b", re.IGNORECASE)
+
+# Statuses always present in the status_summary of incident/service listings
+_INCIDENT_STATUSES = ("triggered", "acknowledged", "resolved")
+_SERVICE_STATUSES = ("active", "warning", "critical", "maintenance", "disabled")
+
+# Log entry types reported by get_recent_alerts
+_TRIGGER_TYPES = frozenset({"trigger_log_entry", "alert_log_entry"})
+
+# Side-loaded with the incident so details need no extra log_entries call
+_INCIDENT_DETAIL_INCLUDES = ["acknowledgers", "first_trigger_log_entries"]
+
+
+def _orjson_response_hook(response: Any, *args: Any, **kwargs: Any) -> Any:
+    """
+    requests response hook that makes response.json() decode with orjson.
+
+    pdpyras decodes every page through response.json(); shadowing the
+    method on each response swaps the parser for this session only instead
+    of patching requests globally.
+    """
+    if "json" in response.headers.get("Content-Type", ""):
+        response.json = lambda **_: orjson.loads(response.content)
+    return response
+
+
+def _to_columns(rows: list[dict]) -> dict:
+    """Transpose same-shaped records into {"columns": {field: values}, "row_count": n}."""
+    fields = rows[0].keys() if rows else ()
+    return {
+        "columns": {f: [row[f] for row in rows] for f in fields},
+        "row_count": len(rows),
+    }
+
+
+def _freeze(params: dict) -> tuple:
+    """Turn a query-params dict into a hashable, order-independent cache key."""
+    return tuple(sorted(
+        (k, tuple(v) if isinstance(v, list) else v) for k, v in params.items()
+    ))
+
+
+def _incident_summary(incident: dict) -> dict:
+    """Project a raw PagerDuty incident onto the fields shared by the incident tools."""
+    service = incident.get("service") or {}
+    return {
+        "id": incident.get("id"),
+        "incident_number": incident.get("incident_number"),
+        "title": incident.get("title"),
+        "status": incident.get("status", "unknown"),
+        "urgency": incident.get("urgency"),
+        "created_at": incident.get("created_at"),
+        "service": {
+            "id": service.get("id"),
+            "name": service.get("summary"),
+        },
+        "assigned_to": tuple(
+            a["assignee"].get("summary")
+            for a in incident.get("assignments") or ()
+            if "assignee" in a
+        ),
+        "escalation_policy": (incident.get("escalation_policy") or {}).get("summary"),
+        "html_url": incident.get("html_url"),
+    }
 
 
 @dataclass
@@ -20,6 +133,12 @@ class PagerDutyTools:
 
     api_key: str
     _session: Any = None
+    _cache: TTLCache = field(default_factory=lambda: TTLCache(ttl=_CACHE_TTL), repr=False)
+    _flights: SingleFlight = field(default_factory=SingleFlight, repr=False)
+    # Bumped by every acknowledge/resolve; incident fetches that started
+    # before a write neither share a flight with nor get cached over it
+    _incidents_generation: int = field(default=0, repr=False)
+    _generation_lock: Lock = field(default_factory=Lock, repr=False)
 
     def __post_init__(self):
         """Initialize PagerDuty API session lazily."""
@@ -28,8 +147,21 @@ class PagerDutyTools:
 
         try:
             from pdpyras import APISession
+            from requests.adapters import HTTPAdapter
 
             self._session = APISession(self.api_key, default_from="sre-copilot@example.com")
+            # requests' default pool keeps 10 connections per host; concurrent
+            # tool calls beyond that would open (and discard) fresh TLS
+            # connections. Retries go through pdpyras' own policy (with its
+            # backoff) rather than a urllib3 Retry on the adapter, which would
+            # surface exhausted retries as a different exception type.
+            self._session.mount(
+                "https://",
+                HTTPAdapter(pool_connections=4, pool_maxsize=_CONNECTION_POOL_MAXSIZE),
+            )
+            self._session.retry = dict(_HTTP_RETRY)
+            if orjson is not None:
+                self._session.hooks["response"].append(_orjson_response_hook)
         except ImportError:
             pass
 
@@ -37,22 +169,107 @@ class PagerDutyTools:
         """Ensure API session is initialized."""
         return self._session is not None
 
+    def _get_page(self, path: str, params: dict, offset: int, page_size: int) -> dict:
+        """GET one page of a classic-paginated list endpoint and return the decoded body."""
+        response = self._session.get(path, params={**params, "limit": page_size, "offset": offset, "total": "true"})
+        response.raise_for_status()
+        return response.json()
+
+    def _parallel_fetch(self, path: str, params: dict, limit: int) -> tuple[list[dict], Optional[int]]:
+        """
+        Fetch up to limit records from a list endpoint, pages in parallel.
+
+        The first page is requested with total=true; the remaining offsets
+        are then known up front and fetched concurrently instead of walking
+        the `more` flag one page at a time.
+
+        Args:
+            path: List endpoint (e.g., "incidents")
+            params: Query parameters, excluding limit/offset
+            limit: Maximum records to return
+
+        Returns:
+            (records in API order, total matching records reported by PagerDuty)
+        """
+        key = path.rsplit("/", 1)[-1]
+        limit = min(limit, _MAX_LIST_RESULTS)
+        page_size = min(limit, _MAX_PAGE_SIZE)
+
+        first = self._get_page(path, params, 0, page_size)
+        records = first.get(key, [])
+        total = first.get("total")
+        offsets = range(page_size, min(limit, total or limit), page_size)
+        if not first.get("more") or not offsets:
+            return records[:limit], total
+
+        with ThreadPoolExecutor(max_workers=min(len(offsets), _PAGE_FETCH_WORKERS)) as pool:
+            for page in pool.map(lambda offset: self._get_page(path, params, offset, page_size), offsets):
+                records.extend(page.get(key, []))
+
+        return records[:limit], total
+
+    def _cached_call(
+        self, key: tuple, ttl: float, fetch: Callable[[], Any], fresh: bool = False
+    ) -> tuple[Any, Optional[float]]:
+        """
+        Return fetch() through the response cache, falling back to stale data.
+
+        On a miss, concurrent calls with the same key share one fetch. If
+        the fetch fails, a cached value up to _MAX_STALE_AGE old is returned
+        instead; otherwise the error propagates.
+
+        Args:
+            key: Cache key
+            ttl: Seconds a fresh result is reused
+            fetch: Zero-argument callable that queries PagerDuty
+            fresh: Skip the cache lookup (the result is still stored)
+
+        Returns:
+            (value, stale_age) where stale_age is None for live or fresh
+            cached data, or the age in seconds of the cached value returned
+            because PagerDuty failed
+        """
+        if not fresh:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached, None
+
+        generation = self._incidents_generation if key[0] == "incidents" else None
+        try:
+            value = self._flights.do((key, generation), fetch)
+        except Exception:
+            stale = self._cache.get_stale(key, max_age=_MAX_STALE_AGE)
+            if stale is None:
+                raise
+            return stale
+
+        # An acknowledge/resolve landed mid-fetch; the result may predate it
+        if generation is None or generation == self._incidents_generation:
+            self._cache.set(key, value, ttl=ttl)
+        return value, None
+
+    def _invalidate_incidents(self) -> None:
+        """Drop cached incident listings after a write so the next read sees the new status."""
+        with self._generation_lock:
+            self._incidents_generation += 1
+        self._cache.discard(lambda key: key[0] == "incidents")
+
     def _handle_error(self, e: Exception, operation: str = "operation") -> dict:
         """Handle errors and return user-friendly messages, especially for authentication errors."""
         error_str = str(e)
-        error_lower = error_str.lower()
-        
+        match = _AUTH_ERROR_RE.search(error_str)
+
         # Check for authentication/authorization errors
-        if "401" in error_str or "unauthorized" in error_lower or "authentication" in error_lower:
+        if match and match.group(1):
             if not self.api_key:
                 return {"error": "PagerDuty API key not configured. Please add PAGERDUTY_API_KEY environment variable."}
             else:
                 return {"error": "PagerDuty authentication failed. Please check that your API key is valid."}
-        
+
         # Check for permission errors
-        if "403" in error_str or "forbidden" in error_lower:
+        if match and match.group(2):
             return {"error": "PagerDuty permission denied. Please check that your API key has the required permissions."}
-        
+
         # Generic error
         return {"error": f"Failed to {operation}: {error_str}"}
 
@@ -62,6 +279,7 @@ class PagerDutyTools:
         urgency: Optional[str] = None,
         service_ids: Optional[list[str]] = None,
         limit: int = 25,
+        columnar: bool = False,
     ) -> dict:
         """
         List PagerDuty incidents.
@@ -71,6 +289,9 @@ class PagerDutyTools:
             urgency: Filter by urgency (high, low)
             service_ids: Filter by service IDs
             limit: Maximum incidents to return
+            columnar: Return incidents as {"columns": {field: [values]}}
+                instead of one dict per incident; field names aren't
+                repeated, which keeps large listings compact
 
         Returns:
             List of incidents with details
@@ -78,8 +299,10 @@ class PagerDutyTools:
         if not self._ensure_session():
             return {"error": "PagerDuty client not configured"}
 
+        limit = max(1, min(limit, _MAX_LIST_RESULTS))
+
         try:
-            params = {"limit": limit}
+            params = {}
 
             if statuses:
                 params["statuses[]"] = statuses
@@ -93,116 +316,119 @@ class PagerDutyTools:
             if service_ids:
                 params["service_ids[]"] = service_ids
 
-            incidents = self._session.list_all("incidents", params=params)
-
-            results = []
-            status_counts = {"triggered": 0, "acknowledged": 0, "resolved": 0}
+            # Only the pages needed for `limit` are requested, in parallel
+            (incidents, total), stale_age = self._cached_call(
+                ("incidents", _freeze(params), limit),
+                _INCIDENTS_TTL,
+                lambda: self._parallel_fetch("incidents", params, limit),
+            )
 
-            for incident in incidents[:limit]:
-                status = incident.get("status", "unknown")
-                if status in status_counts:
-                    status_counts[status] += 1
+            results = [_incident_summary(incident) for incident in incidents]
+            counts = Counter(r["status"] for r in results)
 
-                results.append({
-                    "id": incident.get("id"),
-                    "incident_number": incident.get("incident_number"),
-                    "title": incident.get("title"),
-                    "status": status,
-                    "urgency": incident.get("urgency"),
-                    "created_at": incident.get("created_at"),
-                    "service": {
-                        "id": incident.get("service", {}).get("id"),
-                        "name": incident.get("service", {}).get("summary"),
-                    },
-                    "assigned_to": [
-                        a.get("assignee", {}).get("summary")
-                        for a in incident.get("assignments", [])
-                    ],
-                    "escalation_policy": incident.get("escalation_policy", {}).get("summary"),
-                    "html_url": incident.get("html_url"),
-                })
-
-            return {
-                "incidents": results,
+            result = {
+                "incidents": _to_columns(results) if columnar else results,
                 "total_count": len(results),
-                "status_summary": status_counts,
+                "status_summary": {s: counts[s] for s in _INCIDENT_STATUSES},
             }
+            if total and total > len(results):
+                # More incidents match than were returned; tell the agent to
+                # narrow the query rather than ask for more.
+                result["truncated"] = True
+                result["total_estimate"] = total
+            if stale_age is not None:
+                result["stale"] = True
+                result["stale_age_seconds"] = round(stale_age)
+            return result
 
         except Exception as e:
             return self._handle_error(e, "fetch incidents")
 
-    def get_incident_details(self, incident_id: str) -> dict:
+    def get_incident_details(self, incident_id: str, include_timeline: bool = False) -> dict:
         """
         Get detailed information about a specific incident.
 
+        The first trigger and acknowledgers are side-loaded with the incident
+        via include[]; the full log-entry timeline costs an extra request and
+        is only fetched on demand.
+
         Args:
             incident_id: PagerDuty incident ID
+            include_timeline: Also fetch the last 20 log entries
 
         Returns:
-            Incident details including timeline and notes
+            Incident details including first trigger, notes and optional timeline
         """
         if not self._ensure_session():
             return {"error": "PagerDuty client not configured"}
 
-        try:
-            incident = self._session.rget(f"incidents/{incident_id}")
-
-            # Get incident notes
-            notes = []
+        def fetch_notes() -> list:
             try:
                 notes_response = self._session.rget(f"incidents/{incident_id}/notes")
-                notes = [
-                    {
-                        "content": n.get("content"),
-                        "created_at": n.get("created_at"),
-                        "user": n.get("user", {}).get("summary"),
-                    }
-                    for n in notes_response.get("notes", [])[:10]
-                ]
             except Exception:
-                pass
+                return []
+            return [
+                {
+                    "content": n.get("content"),
+                    "created_at": n.get("created_at"),
+                    "user": n.get("user", {}).get("summary"),
+                }
+                for n in notes_response.get("notes", [])[:10]
+            ]
 
-            # Get log entries (timeline)
-            timeline = []
+        def fetch_timeline() -> list:
             try:
-                log_entries = self._session.list_all(
-                    f"incidents/{incident_id}/log_entries",
-                    params={"limit": 20}
-                )
-                timeline = [
+                return [
                     {
                         "type": entry.get("type"),
                         "created_at": entry.get("created_at"),
                         "summary": entry.get("summary"),
                         "agent": entry.get("agent", {}).get("summary"),
                     }
-                    for entry in log_entries[:20]
+                    for entry in islice(
+                        self._session.iter_all(f"incidents/{incident_id}/log_entries", page_size=20),
+                        20,
+                    )
                 ]
             except Exception:
-                pass
+                return []
 
-            return {
-                "id": incident.get("id"),
-                "incident_number": incident.get("incident_number"),
-                "title": incident.get("title"),
-                "status": incident.get("status"),
-                "urgency": incident.get("urgency"),
-                "created_at": incident.get("created_at"),
+        try:
+            # The requests are independent; issue them together over the
+            # session's connection pool instead of back to back.
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                incident_future = pool.submit(
+                    self._session.rget,
+                    f"incidents/{incident_id}",
+                    params={"include[]": _INCIDENT_DETAIL_INCLUDES},
+                )
+                notes_future = pool.submit(fetch_notes)
+                timeline_future = pool.submit(fetch_timeline) if include_timeline else None
+                incident = incident_future.result()
+                notes = notes_future.result()
+                timeline = timeline_future.result() if timeline_future else None
+
+            first_trigger = incident.get("first_trigger_log_entry") or {}
+
+            result = {
+                **_incident_summary(incident),
                 "resolved_at": incident.get("resolved_at"),
                 "description": incident.get("description"),
-                "service": {
-                    "id": incident.get("service", {}).get("id"),
-                    "name": incident.get("service", {}).get("summary"),
-                },
-                "assigned_to": [
-                    a.get("assignee", {}).get("summary")
-                    for a in incident.get("assignments", [])
-                ],
-                "escalation_policy": incident.get("escalation_policy", {}).get("summary"),
-                "html_url": incident.get("html_url"),
+                "acknowledged_by": tuple(
+                    a["acknowledger"].get("summary")
+                    for a in incident.get("acknowledgements") or ()
+                    if "acknowledger" in a
+                ),
+                "first_trigger": {
+                    "created_at": first_trigger.get("created_at"),
+                    "summary": first_trigger.get("summary"),
+                    "channel": first_trigger.get("channel", {}).get("summary"),
+                } if first_trigger else None,
                 "notes": notes,
-                "timeline": timeline,
             }
+            if timeline is not None:
+                result["timeline"] = timeline
+            return result
 
         except Exception as e:
             return self._handle_error(e, "fetch incident details")
@@ -232,44 +458,52 @@ class PagerDutyTools:
             if escalation_policy_ids:
                 params["escalation_policy_ids[]"] = escalation_policy_ids
 
-            oncalls = self._session.list_all("oncalls", params=params)
-
-            results = []
-            seen = set()
-
-            for oncall in oncalls:
-                user = oncall.get("user") or {}
-                schedule = oncall.get("schedule") or {}
-                escalation_policy = oncall.get("escalation_policy") or {}
-
-                key = f"{user.get('id')}:{schedule.get('id')}:{oncall.get('escalation_level')}"
-                if key in seen:
-                    continue
-                seen.add(key)
-
-                results.append({
-                    "user": {
-                        "id": user.get("id"),
-                        "name": user.get("summary"),
-                        "email": user.get("email"),
-                    },
-                    "schedule": {
-                        "id": schedule.get("id"),
-                        "name": schedule.get("summary"),
-                    } if schedule else None,
-                    "escalation_policy": {
-                        "id": escalation_policy.get("id"),
-                        "name": escalation_policy.get("summary"),
-                    } if escalation_policy else None,
-                    "escalation_level": oncall.get("escalation_level"),
-                    "start": oncall.get("start"),
-                    "end": oncall.get("end"),
-                })
-
-            return {
+            # Records are deduplicated and trimmed while streaming pages, so
+            # neither the raw response nor the cache holds full on-call objects.
+            def fetch() -> list:
+                results = []
+                seen = set()
+
+                for oncall in self._session.iter_all("oncalls", params=params):
+                    user = oncall.get("user") or {}
+                    schedule = oncall.get("schedule") or {}
+                    escalation_policy = oncall.get("escalation_policy") or {}
+
+                    key = (user.get("id"), schedule.get("id"), oncall.get("escalation_level"))
+                    if key in seen:
+                        continue
+                    seen.add(key)
+
+                    results.append({
+                        "user": {
+                            "id": user.get("id"),
+                            "name": user.get("summary"),
+                            "email": user.get("email"),
+                        },
+                        "schedule": {
+                            "id": schedule.get("id"),
+                            "name": schedule.get("summary"),
+                        } if schedule else None,
+                        "escalation_policy": {
+                            "id": escalation_policy.get("id"),
+                            "name": escalation_policy.get("summary"),
+                        } if escalation_policy else None,
+                        "escalation_level": oncall.get("escalation_level"),
+                        "start": oncall.get("start"),
+                        "end": oncall.get("end"),
+                    })
+                return results
+
+            results, stale_age = self._cached_call(("oncalls", _freeze(params)), _ONCALL_TTL, fetch)
+
+            result = {
                 "oncalls": results,
                 "count": len(results),
             }
+            if stale_age is not None:
+                result["stale"] = True
+                result["stale_age_seconds"] = round(stale_age)
+            return result
 
         except Exception as e:
             return self._handle_error(e, "fetch on-call information")
@@ -279,14 +513,21 @@ class PagerDutyTools:
         name_filter: Optional[str] = None,
         include_status: bool = True,
         limit: int = 50,
+        fresh: bool = False,
+        team_ids: Optional[list[str]] = None,
     ) -> dict:
         """
         List PagerDuty services and their status.
 
+        Filters are applied by PagerDuty and results come back sorted by name,
+        so only the services that are returned are paged over.
+
         Args:
             name_filter: Filter services by name
             include_status: Include current status information
             limit: Maximum services to return
+            fresh: Bypass the in-process cache and query PagerDuty directly
+            team_ids: Only return services owned by these team IDs
 
         Returns:
             List of services with status
@@ -294,37 +535,49 @@ class PagerDutyTools:
         if not self._ensure_session():
             return {"error": "PagerDuty client not configured"}
 
+        limit = max(1, min(limit, _MAX_LIST_RESULTS))
+
         try:
-            params = {"limit": limit}
+            params = {"sort_by": "name"}
             if name_filter:
                 params["query"] = name_filter
-
-            services = self._session.list_all("services", params=params)
+            if team_ids:
+                params["team_ids[]"] = team_ids
+
+            services, stale_age = self._cached_call(
+                ("services", _freeze(params), limit),
+                _SERVICES_TTL,
+                lambda: list(islice(
+                    self._session.iter_all("services", params=params, page_size=min(limit, _MAX_PAGE_SIZE)),
+                    limit,
+                )),
+                fresh=fresh,
+            )
 
             results = []
-            status_counts = {"active": 0, "warning": 0, "critical": 0, "maintenance": 0, "disabled": 0}
-
-            for service in services[:limit]:
-                status = service.get("status", "unknown")
-                if status in status_counts:
-                    status_counts[status] += 1
-
+            for service in services:
                 results.append({
                     "id": service.get("id"),
                     "name": service.get("name"),
                     "description": service.get("description", "")[:200] if service.get("description") else None,
-                    "status": status,
+                    "status": service.get("status", "unknown"),
                     "escalation_policy": service.get("escalation_policy", {}).get("summary"),
                     "created_at": service.get("created_at"),
                     "html_url": service.get("html_url"),
                     "incident_urgency_rule": service.get("incident_urgency_rule", {}).get("type"),
                 })
 
-            return {
+            counts = Counter(r["status"] for r in results)
+
+            result = {
                 "services": results,
                 "total_count": len(results),
-                "status_summary": status_counts,
+                "status_summary": {s: counts[s] for s in _SERVICE_STATUSES},
             }
+            if stale_age is not None:
+                result["stale"] = True
+                result["stale_age_seconds"] = round(stale_age)
+            return result
 
         except Exception as e:
             return self._handle_error(e, "fetch services")
@@ -351,6 +604,7 @@ class PagerDutyTools:
             }
 
             result = self._session.rput(f"incidents/{incident_id}", json=payload)
+            self._invalidate_incidents()
 
             return {
                 "success": True,
@@ -388,6 +642,7 @@ class PagerDutyTools:
                 payload["incident"]["resolution"] = resolution
 
             result = self._session.rput(f"incidents/{incident_id}", json=payload)
+            self._invalidate_incidents()
 
             return {
                 "success": True,
@@ -399,6 +654,75 @@ class PagerDutyTools:
         except Exception as e:
             return self._handle_error(e, "resolve incident")
 
+    def bulk_update(
+        self,
+        status: str,
+        incident_ids: list[str],
+        resolution: Optional[str] = None,
+    ) -> dict:
+        """
+        Acknowledge or resolve several incidents with bulk PUT /incidents requests.
+
+        Args:
+            status: New status, "acknowledged" or "resolved"
+            incident_ids: PagerDuty incident IDs
+            resolution: Optional resolution note (only used when resolving)
+
+        Returns:
+            Updated incidents and any batches that failed
+        """
+        if not self._ensure_session():
+            return {"error": "PagerDuty client not configured"}
+
+        if status not in ("acknowledged", "resolved"):
+            return {"error": f"Unsupported status '{status}'. Use 'acknowledged' or 'resolved'."}
+
+        incident_ids = list(dict.fromkeys(incident_ids or []))
+        if not incident_ids:
+            return {"error": "No incident IDs provided"}
+
+        updated = []
+        failed = []
+        for start in range(0, len(incident_ids), _BULK_UPDATE_MAX):
+            batch = incident_ids[start:start + _BULK_UPDATE_MAX]
+            incidents = []
+            for incident_id in batch:
+                incident = {"id": incident_id, "type": "incident_reference", "status": status}
+                if resolution and status == "resolved":
+                    incident["resolution"] = resolution
+                incidents.append(incident)
+
+            try:
+                response = self._session.put("incidents", json={"incidents": incidents})
+                response.raise_for_status()
+                for incident in response.json().get("incidents", []):
+                    updated.append({"id": incident.get("id"), "status": incident.get("status", status)})
+            except Exception as e:
+                error = self._handle_error(e, f"update incidents to {status}")["error"]
+                failed.extend({"id": incident_id, "error": error} for incident_id in batch)
+
+        if updated:
+            self._invalidate_incidents()
+
+        result = {
+            "success": not failed,
+            "new_status": status,
+            "updated": updated,
+            "count": len(updated),
+            "message": f"{len(updated)} of {len(incident_ids)} incidents {status}",
+        }
+        if failed:
+            result["failed"] = failed
+        return result
+
+    def acknowledge_incidents(self, incident_ids: list[str]) -> dict:
+        """Acknowledge several incidents at once (see bulk_update)."""
+        return self.bulk_update("acknowledged", incident_ids)
+
+    def resolve_incidents(self, incident_ids: list[str], resolution: Optional[str] = None) -> dict:
+        """Resolve several incidents at once (see bulk_update)."""
+        return self.bulk_update("resolved", incident_ids, resolution=resolution)
+
     def get_recent_alerts(
         self,
         service_id: Optional[str] = None,
@@ -419,13 +743,14 @@ class PagerDutyTools:
         if not self._ensure_session():
             return {"error": "PagerDuty client not configured"}
 
+        limit = max(1, min(limit, _MAX_LIST_RESULTS))
+
         try:
-            since = (datetime.utcnow() - timedelta(hours=since_hours)).isoformat() + "Z"
+            from datetime import datetime, timedelta, timezone
 
-            params = {
-                "since": since,
-                "limit": limit,
-            }
+            since = (datetime.now(timezone.utc) - timedelta(hours=since_hours)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+            params = {"since": since}
 
             if service_id:
                 path = f"services/{service_id}/log_entries"
@@ -433,24 +758,27 @@ class PagerDutyTools:
                 path = "log_entries"
                 params["is_overview"] = True
 
-            log_entries = self._session.list_all(path, params=params)
+            # Pages are fetched lazily and iteration stops at `limit` alerts
+            log_entries = self._session.iter_all(path, params=params, page_size=min(limit, _MAX_PAGE_SIZE))
 
             # Filter to trigger events
             alerts = []
             for entry in log_entries:
-                if entry.get("type") not in ["trigger_log_entry", "alert_log_entry"]:
+                entry_type = entry.get("type")
+                if entry_type not in _TRIGGER_TYPES:
                     continue
 
+                incident = entry.get("incident")
                 alerts.append({
                     "id": entry.get("id"),
-                    "type": entry.get("type"),
+                    "type": entry_type,
                     "created_at": entry.get("created_at"),
                     "summary": entry.get("summary"),
                     "service": entry.get("service", {}).get("summary"),
                     "incident": {
-                        "id": entry.get("incident", {}).get("id"),
-                        "summary": entry.get("incident", {}).get("summary"),
-                    } if entry.get("incident") else None,
+                        "id": incident.get("id"),
+                        "summary": incident.get("summary"),
+                    } if incident else None,
                 })
 
                 if len(alerts) >= limit:
@@ -465,6 +793,33 @@ class PagerDutyTools:
         except Exception as e:
             return self._handle_error(e, "fetch alerts")
 
+    def dashboard_snapshot(self, incident_limit: int = 25, service_limit: int = 50) -> dict:
+        """
+        Get active incidents, current on-call and service status in one call.
+
+        The three lookups are independent and run concurrently over the
+        shared session, so the snapshot costs about as long as the slowest.
+
+        Args:
+            incident_limit: Maximum active incidents to return
+            service_limit: Maximum services to return
+
+        Returns:
+            Results of get_incidents, get_oncall and get_services keyed by section
+        """
+        if not self._ensure_session():
+            return {"error": "PagerDuty client not configured"}
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            incidents = pool.submit(self.get_incidents, limit=incident_limit)
+            oncall = pool.submit(self.get_oncall)
+            services = pool.submit(self.get_services, limit=service_limit)
+            return {
+                "incidents": incidents.result(),
+                "oncall": oncall.result(),
+                "services": services.result(),
+            }
+
 
 # Tool definitions for Claude
 PAGERDUTY_TOOLS = [
@@ -494,12 +849,17 @@ PAGERDUTY_TOOLS = [
                     "description": "Maximum incidents to return (default: 25)",
                     "default": 25,
                 },
+                "columnar": {
+                    "type": "boolean",
+                    "description": "Return incidents as per-field columns instead of one object per incident. More compact for large listings. Default: false",
+                    "default": False,
+                },
             },
         },
     },
     {
         "name": "pagerduty_get_incident_details",
-        "description": "Get detailed information about a specific PagerDuty incident including timeline and notes.",
+        "description": "Get detailed information about a specific PagerDuty incident including first trigger, acknowledgers, notes and (optionally) the timeline.",
         "input_schema": {
             "type": "object",
             "properties": {
@@ -507,6 +867,11 @@ PAGERDUTY_TOOLS = [
                     "type": "string",
                     "description": "PagerDuty incident ID",
                 },
+                "include_timeline": {
+                    "type": "boolean",
+                    "description": "Also fetch the last 20 log entries (extra API call). Default: false",
+                    "default": False,
+                },
             },
             "required": ["incident_id"],
         },
@@ -540,11 +905,21 @@ PAGERDUTY_TOOLS = [
                     "type": "string",
                     "description": "Filter services by name (substring match)",
                 },
+                "team_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Only return services owned by these team IDs",
+                },
                 "limit": {
                     "type": "integer",
                     "description": "Maximum services to return (default: 50)",
                     "default": 50,
                 },
+                "fresh": {
+                    "type": "boolean",
+                    "description": "Skip the 30s cache and fetch live data (default: false)",
+                    "default": False,
+                },
             },
         },
     },
@@ -580,6 +955,40 @@ PAGERDUTY_TOOLS = [
             "required": ["incident_id"],
         },
     },
+    {
+        "name": "pagerduty_acknowledge_incidents",
+        "description": "Acknowledge several PagerDuty incidents in one request. Prefer this over repeated single acknowledgements.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "incident_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "PagerDuty incident IDs to acknowledge",
+                },
+            },
+            "required": ["incident_ids"],
+        },
+    },
+    {
+        "name": "pagerduty_resolve_incidents",
+        "description": "Resolve several PagerDuty incidents in one request. Prefer this over repeated single resolutions.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "incident_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "PagerDuty incident IDs to resolve",
+                },
+                "resolution": {
+                    "type": "string",
+                    "description": "Optional resolution note applied to every incident",
+                },
+            },
+            "required": ["incident_ids"],
+        },
+    },
     {
         "name": "pagerduty_get_recent_alerts",
         "description": "Get recent alerts/triggers from PagerDuty. Use this to see what alerts have fired recently.",
@@ -603,4 +1012,23 @@ PAGERDUTY_TOOLS = [
             },
         },
     },
+    {
+        "name": "pagerduty_get_dashboard",
+        "description": "Get active incidents, who is on-call, and service status in a single call. Use this for an overall PagerDuty picture instead of calling the three tools separately.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "incident_limit": {
+                    "type": "integer",
+                    "description": "Maximum active incidents to return (default: 25)",
+                    "default": 25,
+                },
+                "service_limit": {
+                    "type": "integer",
+                    "description": "Maximum services to return (default: 50)",
+                    "default": 50,
+                },
+            },
+        },
+    },
 ]
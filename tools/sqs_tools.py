@@ -8,12 +8,213 @@ Provides read-only tools for:
 - Getting dead-letter queue statistics
 """
 
-from dataclasses import dataclass
-from typing import Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps
+from itertools import islice
+from threading import Lock
+from typing import Any, Callable, Iterator, Optional, List
+import base64
 import json
+import time
+
+from tools.cache import TTLCache
+
+# Message bodies can be up to 256 KiB each; orjson parses them several
+# times faster when installed. Its JSONDecodeError subclasses the stdlib one.
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    from botocore.exceptions import ClientError, NoCredentialsError
+except ImportError:
+    # boto3 not installed; SQSTools reports that from __post_init__. These
+    # stand-ins keep the except/isinstance checks valid without it.
+    class ClientError(Exception):
+        pass
+
+    class NoCredentialsError(Exception):
+        pass
+
+# The queue catalog changes rarely; repeat listings are served from memory
+# for this long (seconds)
+_CACHE_TTL = 30
+
+# Queue depth moves constantly, so attribute lookups are only reused for a
+# few seconds: enough to absorb repeat calls within one agent turn
+_ATTRIBUTES_TTL = 10
+
+# Attributes get_queue_attributes reports; requesting "All" would also
+# return policies and KMS settings that are never shown
+_DEFAULT_ATTRS = (
+    "ApproximateNumberOfMessages",
+    "ApproximateNumberOfMessagesDelayed",
+    "ApproximateNumberOfMessagesNotVisible",
+    "VisibilityTimeout",
+    "MessageRetentionPeriod",
+    "MaximumMessageSize",
+    "DelaySeconds",
+    "CreatedTimestamp",
+    "LastModifiedTimestamp",
+    "RedrivePolicy",
+    "FifoQueue",
+    "ContentBasedDeduplication",
+    "DeduplicationScope",
+    "FifoThroughputLimit",
+)
+
+# (SQS attribute, result key, cast) for the metrics and configuration
+# sections of get_queue_attributes. Attributes SQS didn't return are left
+# out rather than reported as 0.
+_METRIC_FIELDS = (
+    ("ApproximateNumberOfMessages", "approximate_messages", int),
+    ("ApproximateNumberOfMessagesDelayed", "approximate_messages_delayed", int),
+    ("ApproximateNumberOfMessagesNotVisible", "approximate_messages_not_visible", int),
+)
+_CONFIG_FIELDS = (
+    ("VisibilityTimeout", "visibility_timeout_seconds", int),
+    ("MessageRetentionPeriod", "message_retention_seconds", int),
+    ("MaximumMessageSize", "max_message_size_bytes", int),
+    ("DelaySeconds", "delay_seconds", int),
+)
+
+# get_queue_url remembers "queue does not exist" for this long (seconds) so
+# retried lookups of a wrong name don't each cost a round trip
+_MISSING_QUEUE_TTL = 60
+
+# Error codes SQS uses for an unknown queue (query and JSON protocols)
+_MISSING_QUEUE_CODES = frozenset({"AWS.SimpleQueueService.NonExistentQueue", "QueueDoesNotExist"})
+
+# SQS reports boolean attributes as "true"/"false" strings
+_TRUE = frozenset({"true", "True", "TRUE"})
+
+# Concurrent requests when fetching attributes for many queues at once
+_MAX_WORKERS = 10
+
+# Queue-name fragments (lowercase) that mark a queue as a dead-letter queue
+_DLQ_MARKERS = ("dlq", "dead-letter", "deadletter")
+
+# The only attribute find_dlqs_with_messages needs
+_DLQ_ATTRS = ["ApproximateNumberOfMessages"]
+
+
+def _queue_name(queue_url: str) -> str:
+    """Queue name from a queue URL (its last path segment)."""
+    return queue_url.rsplit("/", 1)[-1]
+
+
+def _attr_value(attr: dict) -> Optional[str]:
+    """Value of a message attribute; binary values are base64-encoded so they serialize as JSON."""
+    if "StringValue" in attr:
+        return attr["StringValue"]
+    if "BinaryValue" in attr:
+        return base64.b64encode(attr["BinaryValue"]).decode("ascii")
+    return None
+
+
+def _timed(method: Callable[..., dict]) -> Callable[..., dict]:
+    """
+    Report a tool method's latency and outcome to SQSTools.metrics_hook.
+
+    The hook receives (operation, elapsed_seconds, error_code), where
+    error_code is None on success. Without a hook the method is called
+    directly.
+    """
+    @wraps(method)
+    def wrapper(self: "SQSTools", *args: Any, **kwargs: Any) -> dict:
+        if self.metrics_hook is None:
+            return method(self, *args, **kwargs)
+
+        start = time.perf_counter()
+        result = method(self, *args, **kwargs)
+        error_code = result.get("error_code", "Error") if "error" in result else None
+        self.metrics_hook(method.__name__, time.perf_counter() - start, error_code)
+        return result
+
+    return wrapper
+
+
+@lru_cache(maxsize=1)
+def prometheus_metrics_hook() -> Callable[[str, float, Optional[str]], None]:
+    """
+    Build a metrics_hook that records into prometheus_client.
+
+    Exposes sqs_tool_latency_seconds{operation} and
+    sqs_tool_errors_total{operation,code}. The metrics are registered once
+    per process, so every SQSTools can share the returned hook.
+
+    Raises:
+        ImportError: prometheus_client is not installed
+    """
+    from prometheus_client import Counter, Histogram
+
+    latency = Histogram("sqs_tool_latency_seconds", "SQS tool call latency", ["operation"])
+    errors = Counter("sqs_tool_errors_total", "SQS tool call errors", ["operation", "code"])
+
+    def hook(operation: str, elapsed: float, error_code: Optional[str]) -> None:
+        latency.labels(operation).observe(elapsed)
+        if error_code is not None:
+            errors.labels(operation, error_code).inc()
+
+    return hook
+
+
+# boto3 Sessions are not thread-safe; creating clients from a shared one
+# is serialized
+_SESSION_LOCK = Lock()
+
+
+@lru_cache(maxsize=8)
+def _boto3_session(profile: Optional[str] = None) -> Any:
+    """
+    Build (once per profile) a boto3 Session.
+
+    Session construction reads and parses the AWS config and credential
+    files, so clients for different regions/keys reuse the same one.
+    """
+    import boto3
 
+    return boto3.Session(profile_name=profile) if profile else boto3.Session()
 
-@dataclass
+
+@lru_cache(maxsize=8)
+def _sqs_client(
+    region: str,
+    profile: Optional[str] = None,
+    access_key: Optional[str] = None,
+    secret_key: Optional[str] = None,
+) -> Any:
+    """
+    Build (once per region/credentials) a boto3 SQS client.
+
+    Creating a session and client re-reads AWS config and re-resolves
+    endpoints, so tool instances with the same settings share one client.
+    boto3 clients are thread-safe.
+    """
+    from botocore.config import Config
+
+    client_kwargs = {"region_name": region}
+    if access_key and secret_key:
+        client_kwargs["aws_access_key_id"] = access_key
+        client_kwargs["aws_secret_access_key"] = secret_key
+
+    config = Config(
+        # Enough keep-alive connections for the batch fan-out (_MAX_WORKERS)
+        # plus concurrent tool calls
+        max_pool_connections=32,
+        tcp_keepalive=True,
+        connect_timeout=2,
+        # Must outlast the longest receive_message long poll (20s)
+        read_timeout=25,
+        retries={"max_attempts": 3, "mode": "adaptive"},
+    )
+    with _SESSION_LOCK:
+        return _boto3_session(profile).client("sqs", config=config, **client_kwargs)
+
+
+@dataclass(slots=True)
 class SQSTools:
     """AWS SQS tools for SRE operations (read-only)."""
 
@@ -21,33 +222,35 @@ class SQSTools:
     aws_access_key: Optional[str] = None
     aws_secret_key: Optional[str] = None
     aws_profile: Optional[str] = None
+    # Probe credentials with a ListQueues call at construction. Off by
+    # default: the first real call reports credential errors anyway.
+    validate_on_init: bool = False
+    # Called as hook(operation, elapsed_seconds, error_code) after each tool
+    # method; see prometheus_metrics_hook
+    metrics_hook: Optional[Callable[[str, float, Optional[str]], None]] = field(default=None, repr=False)
     _client: Any = None
+    _cache: TTLCache = field(default_factory=lambda: TTLCache(ttl=_CACHE_TTL), repr=False)
+    # (queue_name, account_id) -> queue URL; a queue's URL never changes
+    _queue_urls: dict = field(default_factory=dict, repr=False)
+    # Slot for the LangChain tools built by create_sqs_tools
+    _langchain_tools: Any = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Initialize AWS SQS client lazily."""
         try:
-            import boto3
-            from botocore.exceptions import NoCredentialsError, ClientError
-
-            session_kwargs = {}
-            if self.aws_profile:
-                session_kwargs["profile_name"] = self.aws_profile
-
-            session = boto3.Session(**session_kwargs)
-
-            client_kwargs = {"region_name": self.aws_region}
-            if self.aws_access_key and self.aws_secret_key:
-                client_kwargs["aws_access_key_id"] = self.aws_access_key
-                client_kwargs["aws_secret_access_key"] = self.aws_secret_key
-
-            self._client = session.client("sqs", **client_kwargs)
+            self._client = _sqs_client(
+                self.aws_region,
+                self.aws_profile or None,
+                self.aws_access_key or None,
+                self.aws_secret_key or None,
+            )
 
-            # Test connection
-            try:
-                self._client.list_queues(MaxResults=1)
-            except (NoCredentialsError, ClientError) as e:
-                self._client = None
-                print(f"AWS credentials not configured or invalid: {e}")
+            if self.validate_on_init:
+                try:
+                    self._client.list_queues(MaxResults=1)
+                except (NoCredentialsError, ClientError) as e:
+                    self._client = None
+                    print(f"AWS credentials not configured or invalid: {e}")
         except ImportError:
             print("boto3 not installed. Install with: pip install boto3")
             self._client = None
@@ -58,43 +261,59 @@ class SQSTools:
 
     def _handle_error(self, e: Exception, operation: str = "operation") -> dict:
         """Handle errors and return user-friendly messages."""
-        error_str = str(e)
+        if isinstance(e, NoCredentialsError):
+            return {
+                "error": "AWS credentials not configured. Please set AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY, "
+                        "configure AWS CLI, or use IAM roles.",
+                "error_code": "NoCredentials",
+            }
 
-        try:
-            from botocore.exceptions import NoCredentialsError, ClientError
+        if isinstance(e, ClientError):
+            error = e.response.get("Error", {})
+            error_code = error.get("Code", "Unknown")
+            error_message = error.get("Message", str(e))
 
-            if isinstance(e, NoCredentialsError):
-                return {
-                    "error": "AWS credentials not configured. Please set AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY, "
-                            "configure AWS CLI, or use IAM roles."
-                }
+            if error_code == "AccessDenied":
+                return {"error": f"Access denied. Check IAM permissions for SQS: {error_message}", "error_code": error_code}
+            elif error_code == "InvalidAddress":
+                return {"error": f"Invalid queue URL or region: {error_message}", "error_code": error_code}
 
-            if isinstance(e, ClientError):
-                error_code = e.response.get("Error", {}).get("Code", "Unknown")
-                error_message = e.response.get("Error", {}).get("Message", str(e))
+            return {"error": f"AWS SQS error ({error_code}): {error_message}", "error_code": error_code}
 
-                if error_code == "AccessDenied":
-                    return {"error": f"Access denied. Check IAM permissions for SQS: {error_message}"}
-                elif error_code == "InvalidAddress":
-                    return {"error": f"Invalid queue URL or region: {error_message}"}
+        return {"error": f"Failed to {operation}: {e}", "error_code": type(e).__name__}
 
-                return {"error": f"AWS SQS error ({error_code}): {error_message}"}
-        except ImportError:
-            pass
+    def iter_queues(self, queue_name_prefix: Optional[str] = None, page_size: int = 1000) -> Iterator[str]:
+        """
+        Yield queue URLs, requesting further ListQueues pages only as consumed.
 
-        return {"error": f"Failed to {operation}: {error_str}"}
+        Args:
+            queue_name_prefix: Filter queues by name prefix
+            page_size: Queues per ListQueues request (1-1000)
+
+        Yields:
+            Queue URLs
+        """
+        params = {"PaginationConfig": {"PageSize": min(max(1, page_size), 1000)}}
+        if queue_name_prefix:
+            params["QueueNamePrefix"] = queue_name_prefix
 
+        for page in self._client.get_paginator("list_queues").paginate(**params):
+            yield from page.get("QueueUrls", [])
+
+    @_timed
     def list_queues(
         self,
         queue_name_prefix: Optional[str] = None,
         max_results: int = 100,
+        fresh: bool = False,
     ) -> dict:
         """
         List SQS queues.
 
         Args:
             queue_name_prefix: Filter queues by name prefix
-            max_results: Maximum number of queues to return (1-1000)
+            max_results: Maximum number of queues to return
+            fresh: Bypass the in-process cache and query SQS directly
 
         Returns:
             List of queue URLs and names
@@ -102,37 +321,55 @@ class SQSTools:
         if not self._ensure_client():
             return {"error": "AWS SQS client not configured"}
 
-        try:
-            params = {"MaxResults": min(max_results, 1000)}
-            if queue_name_prefix:
-                params["QueueNamePrefix"] = queue_name_prefix
+        cache_key = ("queues", queue_name_prefix, max_results)
+        if not fresh:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-            response = self._client.list_queues(**params)
-            queue_urls = response.get("QueueUrls", [])
+        try:
+            # ListQueues returns at most 1000 queues per page; follow
+            # NextToken only until max_results queues have been read.
+            queue_urls = list(islice(
+                self.iter_queues(queue_name_prefix, page_size=max_results),
+                max(1, max_results),
+            ))
 
-            return {
+            result = {
                 "queues": [
                     {
                         "url": url,
-                        "name": url.split("/")[-1],
+                        "name": _queue_name(url),
                     }
                     for url in queue_urls
                 ],
                 "count": len(queue_urls),
             }
+            self._cache.set(cache_key, result)
+            # Queues that exist now shouldn't keep reporting as missing
+            for queue in result["queues"]:
+                self._cache.pop(("missing_queue", queue["name"], None))
+            return result
 
         except Exception as e:
             return self._handle_error(e, "list queues")
 
+    @_timed
     def get_queue_attributes(
         self,
         queue_url: str,
+        fresh: bool = False,
+        attribute_names: Optional[List[str]] = None,
     ) -> dict:
         """
         Get queue attributes and statistics.
 
         Args:
             queue_url: SQS queue URL
+            fresh: Bypass the in-process cache and query SQS directly
+            attribute_names: Attributes to request from SQS (default:
+                _DEFAULT_ATTRS, the ones reported below; pass ["All"] for
+                everything)
 
         Returns:
             Queue attributes including message counts, age, etc.
@@ -140,45 +377,36 @@ class SQSTools:
         if not self._ensure_client():
             return {"error": "AWS SQS client not configured"}
 
+        attribute_names = tuple(attribute_names or _DEFAULT_ATTRS)
+        cache_key = ("attributes", queue_url, attribute_names)
+        if not fresh:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             response = self._client.get_queue_attributes(
                 QueueUrl=queue_url,
-                AttributeNames=["All"],
+                AttributeNames=list(attribute_names),
             )
 
             attrs = response.get("Attributes", {})
 
             result = {
                 "queue_url": queue_url,
-                "queue_name": queue_url.split("/")[-1],
-                "metrics": {
-                    "approximate_messages": int(attrs.get("ApproximateNumberOfMessages", 0)),
-                    "approximate_messages_delayed": int(attrs.get("ApproximateNumberOfMessagesDelayed", 0)),
-                    "approximate_messages_not_visible": int(attrs.get("ApproximateNumberOfMessagesNotVisible", 0)),
-                },
-                "configuration": {
-                    "visibility_timeout_seconds": int(attrs.get("VisibilityTimeout", 0)),
-                    "message_retention_seconds": int(attrs.get("MessageRetentionPeriod", 0)),
-                    "max_message_size_bytes": int(attrs.get("MaximumMessageSize", 0)),
-                    "delay_seconds": int(attrs.get("DelaySeconds", 0)),
-                },
+                "queue_name": _queue_name(queue_url),
+                "metrics": {out: cast(attrs[k]) for k, out, cast in _METRIC_FIELDS if k in attrs},
+                "configuration": {out: cast(attrs[k]) for k, out, cast in _CONFIG_FIELDS if k in attrs},
                 "timestamps": {
                     "created": attrs.get("CreatedTimestamp"),
                     "last_modified": attrs.get("LastModifiedTimestamp"),
                 },
             }
 
-            # Add age of oldest message if available
-            if "ApproximateAgeOfOldestMessage" in attrs:
-                age_seconds = int(attrs["ApproximateAgeOfOldestMessage"])
-                result["metrics"]["oldest_message_age_seconds"] = age_seconds
-                result["metrics"]["oldest_message_age_minutes"] = round(age_seconds / 60, 2)
-                result["metrics"]["oldest_message_age_hours"] = round(age_seconds / 3600, 2)
-
             # Add DLQ info if available
             if "RedrivePolicy" in attrs:
                 try:
-                    redrive_policy = json.loads(attrs["RedrivePolicy"])
+                    redrive_policy = _loads(attrs["RedrivePolicy"])
                     result["dead_letter_queue"] = {
                         "target_arn": redrive_policy.get("deadLetterTargetArn"),
                         "max_receive_count": redrive_policy.get("maxReceiveCount"),
@@ -187,24 +415,128 @@ class SQSTools:
                     pass
 
             # Check if this is a FIFO queue
-            result["is_fifo"] = attrs.get("FifoQueue", "false").lower() == "true"
+            result["is_fifo"] = attrs.get("FifoQueue") in _TRUE
             if result["is_fifo"]:
                 result["fifo_config"] = {
-                    "content_based_deduplication": attrs.get("ContentBasedDeduplication", "false").lower() == "true",
+                    "content_based_deduplication": attrs.get("ContentBasedDeduplication") in _TRUE,
                     "deduplication_scope": attrs.get("DeduplicationScope"),
                     "fifo_throughput_limit": attrs.get("FifoThroughputLimit"),
                 }
 
+            self._cache.set(cache_key, result, ttl=_ATTRIBUTES_TTL)
             return result
 
         except Exception as e:
             return self._handle_error(e, "get queue attributes")
 
+    @_timed
+    def get_queue_attributes_many(
+        self,
+        queue_urls: list[str],
+        attribute_names: Optional[List[str]] = None,
+    ) -> dict:
+        """
+        Get attributes for several queues concurrently.
+
+        Each queue is fetched with get_queue_attributes on a worker thread;
+        boto3 clients are thread-safe and share one connection pool.
+
+        Args:
+            queue_urls: SQS queue URLs
+            attribute_names: Attributes to request for each queue (default:
+                see get_queue_attributes)
+
+        Returns:
+            Per-queue attributes keyed by queue URL
+        """
+        if not self._ensure_client():
+            return {"error": "AWS SQS client not configured"}
+
+        queue_urls = list(dict.fromkeys(queue_urls or []))
+        if not queue_urls:
+            return {"error": "No queue URLs provided"}
+
+        with ThreadPoolExecutor(max_workers=min(len(queue_urls), _MAX_WORKERS)) as pool:
+            results = dict(zip(queue_urls, pool.map(
+                lambda url: self.get_queue_attributes(url, attribute_names=attribute_names),
+                queue_urls,
+            )))
+
+        return {
+            "queues": results,
+            "count": len(results),
+            "errors": {url: r["error"] for url, r in results.items() if "error" in r},
+        }
+
+    @_timed
+    def find_dlqs_with_messages(self, queue_name_prefix: Optional[str] = None, min_messages: int = 1) -> dict:
+        """
+        Find dead-letter queues holding at least min_messages messages.
+
+        DLQs are recognised by name ("dlq", "dead-letter" or "deadletter",
+        case-insensitive); only their message count is fetched, in parallel.
+        DLQs whose lookup failed are listed under errors rather than being
+        treated as empty.
+
+        Args:
+            queue_name_prefix: Only scan queues with this name prefix
+            min_messages: Minimum approximate message count to report a DLQ
+
+        Returns:
+            DLQs with backlog (largest first) and DLQs that could not be checked
+        """
+        if not self._ensure_client():
+            return {"error": "AWS SQS client not configured"}
+
+        try:
+            dlq_urls = [
+                url for url in self.iter_queues(queue_name_prefix)
+                if any(marker in _queue_name(url).lower() for marker in _DLQ_MARKERS)
+            ]
+        except Exception as e:
+            return self._handle_error(e, "list queues")
+
+        if not dlq_urls:
+            return {"dlqs": [], "count": 0, "scanned": 0, "errors": []}
+
+        batch = self.get_queue_attributes_many(dlq_urls, attribute_names=_DLQ_ATTRS)
+        dlqs = []
+        errors = []
+        for url, attrs in batch["queues"].items():
+            if "error" in attrs:
+                errors.append({"queue_url": url, "queue_name": _queue_name(url), "error": attrs["error"]})
+                continue
+
+            messages = attrs["metrics"].get("approximate_messages")
+            if messages is None:
+                errors.append({
+                    "queue_url": url,
+                    "queue_name": attrs["queue_name"],
+                    "error": "ApproximateNumberOfMessages not returned",
+                })
+            elif messages >= min_messages:
+                dlqs.append({
+                    "queue_url": url,
+                    "queue_name": attrs["queue_name"],
+                    "approximate_messages": messages,
+                })
+        dlqs.sort(key=lambda q: q["approximate_messages"], reverse=True)
+
+        return {
+            "dlqs": dlqs,
+            "count": len(dlqs),
+            "scanned": len(dlq_urls),
+            "errors": errors,
+        }
+
+    @_timed
     def peek_messages(
         self,
         queue_url: str,
         max_messages: int = 10,
-        wait_time_seconds: int = 0,
+        wait_time_seconds: int = 1,
+        include_raw: bool = False,
+        max_body_chars: int = 1000,
     ) -> dict:
         """
         Peek at messages in a queue without removing them.
@@ -212,10 +544,19 @@ class SQSTools:
         Messages are received with visibility timeout of 0, meaning they
         become immediately visible again for other consumers.
 
+        JSON bodies are returned parsed; other bodies are returned as text
+        truncated to max_body_chars.
+
+        A short long poll (1s) is the default: it waits briefly for a message
+        on a sparse queue instead of returning empty, and samples all SQS
+        servers rather than a subset. Pass 0 to return immediately.
+
         Args:
             queue_url: SQS queue URL
             max_messages: Maximum messages to peek at (1-10)
             wait_time_seconds: Long polling wait time (0-20 seconds)
+            include_raw: Also return the (truncated) raw text of JSON bodies
+            max_body_chars: Truncate raw/text bodies to this many characters
 
         Returns:
             List of messages with body and attributes
@@ -238,32 +579,37 @@ class SQSTools:
             parsed_messages = []
             for msg in messages:
                 body = msg.get("Body", "")
-                # Try to parse body as JSON for display
+                body_text = body if len(body) <= max_body_chars else f"{body[:max_body_chars]}..."
+                # Try to parse body as JSON for display; the raw text would
+                # only repeat it, so it is returned on request
                 try:
-                    body_parsed = json.loads(body)
+                    body_parsed = _loads(body)
+                    is_json = True
                 except json.JSONDecodeError:
-                    body_parsed = body
+                    body_parsed = body_text
+                    is_json = False
 
                 attrs = msg.get("Attributes", {})
 
-                parsed_messages.append({
+                parsed = {
                     "message_id": msg.get("MessageId"),
                     "body": body_parsed,
-                    "body_raw": body[:1000] + "..." if len(body) > 1000 else body,
                     "md5_of_body": msg.get("MD5OfBody"),
                     "sent_timestamp": attrs.get("SentTimestamp"),
                     "approximate_receive_count": int(attrs.get("ApproximateReceiveCount", 0)),
                     "approximate_first_receive_timestamp": attrs.get("ApproximateFirstReceiveTimestamp"),
                     "sender_id": attrs.get("SenderId"),
                     "message_attributes": {
-                        k: v.get("StringValue") or v.get("BinaryValue")
-                        for k, v in msg.get("MessageAttributes", {}).items()
+                        k: _attr_value(v) for k, v in msg.get("MessageAttributes", {}).items() if v
                     },
-                })
+                }
+                if is_json and include_raw:
+                    parsed["body_raw"] = body_text
+                parsed_messages.append(parsed)
 
             return {
                 "queue_url": queue_url,
-                "queue_name": queue_url.split("/")[-1],
+                "queue_name": _queue_name(queue_url),
                 "messages": parsed_messages,
                 "count": len(parsed_messages),
                 "note": "Messages peeked with visibility_timeout=0 (not removed from queue)",
@@ -272,6 +618,46 @@ class SQSTools:
         except Exception as e:
             return self._handle_error(e, "peek messages")
 
+    @_timed
+    def peek_messages_many(self, queue_urls: list[str], max_messages: int = 10) -> dict:
+        """
+        Peek at messages in several queues concurrently (read-only).
+
+        Each queue is peeked with peek_messages on a worker thread, without
+        long polling, so the call takes about one round trip overall.
+
+        Args:
+            queue_urls: SQS queue URLs
+            max_messages: Maximum messages to peek at per queue (1-10)
+
+        Returns:
+            Per-queue peek results keyed by queue URL
+        """
+        if not self._ensure_client():
+            return {"error": "AWS SQS client not configured"}
+
+        queue_urls = list(dict.fromkeys(queue_urls or []))
+        if not queue_urls:
+            return {"error": "No queue URLs provided"}
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(len(queue_urls), _MAX_WORKERS)) as pool:
+            futures = {
+                pool.submit(self.peek_messages, url, max_messages=max_messages, wait_time_seconds=0): url
+                for url in queue_urls
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        # Report in request order, not completion order
+        results = {url: results[url] for url in queue_urls}
+        return {
+            "queues": results,
+            "total_messages": sum(r.get("count", 0) for r in results.values()),
+            "errors": {url: r["error"] for url, r in results.items() if "error" in r},
+        }
+
+    @_timed
     def get_queue_url(
         self,
         queue_name: str,
@@ -280,6 +666,9 @@ class SQSTools:
         """
         Get the URL of a queue by its name.
 
+        Successful lookups are remembered for the life of this instance;
+        unknown queue names for _MISSING_QUEUE_TTL seconds.
+
         Args:
             queue_name: Name of the queue
             account_id: AWS account ID (optional, for cross-account access)
@@ -290,20 +679,35 @@ class SQSTools:
         if not self._ensure_client():
             return {"error": "AWS SQS client not configured"}
 
+        cache_key = (queue_name, account_id or None)
+        queue_url = self._queue_urls.get(cache_key)
+        if queue_url:
+            return {"queue_name": queue_name, "queue_url": queue_url}
+
+        missing = self._cache.get(("missing_queue",) + cache_key)
+        if missing is not None:
+            return missing
+
         try:
             params = {"QueueName": queue_name}
             if account_id:
                 params["QueueOwnerAWSAccountId"] = account_id
 
             response = self._client.get_queue_url(**params)
+            queue_url = response.get("QueueUrl")
+            if queue_url:
+                self._queue_urls[cache_key] = queue_url
 
             return {
                 "queue_name": queue_name,
-                "queue_url": response.get("QueueUrl"),
+                "queue_url": queue_url,
             }
 
         except Exception as e:
-            return self._handle_error(e, "get queue URL")
+            result = self._handle_error(e, "get queue URL")
+            if isinstance(e, ClientError) and e.response.get("Error", {}).get("Code") in _MISSING_QUEUE_CODES:
+                self._cache.set(("missing_queue",) + cache_key, result, ttl=_MISSING_QUEUE_TTL)
+            return result
 
 
 # Tool definitions for LangChain
@@ -320,7 +724,7 @@ SQS_TOOLS = [
                 },
                 "max_results": {
                     "type": "integer",
-                    "description": "Maximum number of queues to return (default: 100, max: 1000)",
+                    "description": "Maximum number of queues to return (default: 100)",
                     "default": 100,
                 },
             },
@@ -328,7 +732,7 @@ SQS_TOOLS = [
     },
     {
         "name": "sqs_get_queue_attributes",
-        "description": "Get detailed queue attributes and statistics including message counts, age of oldest message, visibility timeout, and dead-letter queue configuration.",
+        "description": "Get detailed queue attributes and statistics including message counts, visibility timeout, and dead-letter queue configuration.",
         "input_schema": {
             "type": "object",
             "properties": {
@@ -336,10 +740,48 @@ SQS_TOOLS = [
                     "type": "string",
                     "description": "SQS queue URL",
                 },
+                "fresh": {
+                    "type": "boolean",
+                    "description": "Skip the 10s cache and fetch live data (default: false)",
+                    "default": False,
+                },
             },
             "required": ["queue_url"],
         },
     },
+    {
+        "name": "sqs_get_queue_attributes_batch",
+        "description": "Get attributes and statistics for several queues in one call (fetched in parallel). Prefer this over repeated sqs_get_queue_attributes calls, e.g. when checking many DLQs.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "queue_urls": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "SQS queue URLs",
+                },
+            },
+            "required": ["queue_urls"],
+        },
+    },
+    {
+        "name": "sqs_find_dlqs_with_messages",
+        "description": "Find dead-letter queues (names containing dlq/dead-letter) that currently hold messages, with their message counts; DLQs that could not be checked are listed under errors. Use this first when investigating failed message processing.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "queue_name_prefix": {
+                    "type": "string",
+                    "description": "Only scan queues with this name prefix",
+                },
+                "min_messages": {
+                    "type": "integer",
+                    "description": "Minimum message count to report a DLQ (default: 1)",
+                    "default": 1,
+                },
+            },
+        },
+    },
     {
         "name": "sqs_peek_messages",
         "description": "Peek at messages in a queue WITHOUT removing them (read-only). Messages remain visible for other consumers. Use to inspect queue contents.",
@@ -357,13 +799,43 @@ SQS_TOOLS = [
                 },
                 "wait_time_seconds": {
                     "type": "integer",
-                    "description": "Long polling wait time in seconds (0-20, default: 0)",
-                    "default": 0,
+                    "description": "Long polling wait time in seconds (0-20, default: 1)",
+                    "default": 1,
+                },
+                "include_raw": {
+                    "type": "boolean",
+                    "description": "Also return the raw text of JSON message bodies (default: false)",
+                    "default": False,
+                },
+                "max_body_chars": {
+                    "type": "integer",
+                    "description": "Truncate raw/non-JSON bodies to this many characters (default: 1000)",
+                    "default": 1000,
                 },
             },
             "required": ["queue_url"],
         },
     },
+    {
+        "name": "sqs_peek_messages_batch",
+        "description": "Peek at messages in several queues at once WITHOUT removing them (read-only, fetched in parallel). Prefer this over repeated sqs_peek_messages calls, e.g. when inspecting many DLQs.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "queue_urls": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "SQS queue URLs",
+                },
+                "max_messages": {
+                    "type": "integer",
+                    "description": "Maximum messages to peek at per queue (1-10, default: 10)",
+                    "default": 10,
+                },
+            },
+            "required": ["queue_urls"],
+        },
+    },
     {
         "name": "sqs_get_queue_url",
         "description": "Get the URL of a queue by its name. Useful when you know the queue name but need the full URL.",